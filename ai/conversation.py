@@ -511,6 +511,14 @@ class Conversation:
             return self.response_text[:self.response_char_index]
         return self.displayed_text
 
+    def get_full_text(self) -> str:
+        """Get the full current line, ignoring typewriter progress."""
+        if self.showing_response:
+            return self.response_text
+        if self.current_line_index < len(self.dialogue_lines):
+            return self.dialogue_lines[self.current_line_index]
+        return ""
+
     def get_emotion(self) -> str:
         """Get the current emotion for portrait."""
         return self.template.emotion
@@ -590,6 +598,12 @@ class ConversationManager:
             return self.active_conversation.get_current_text()
         return ""
 
+    def get_full_text(self) -> str:
+        """Get the full text of the current line, ignoring typewriter progress."""
+        if self.active_conversation:
+            return self.active_conversation.get_full_text()
+        return ""
+
     def get_emotion(self) -> str:
         """Get the current emotion."""
         if self.active_conversation:
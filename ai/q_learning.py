@@ -74,22 +74,36 @@ class QLearningAgent:
             return MINIGAME_ACTIONS
         return COMBAT_ACTIONS
 
-    def get_q(self, state: tuple, action: int, context: str = 'combat') -> float:
-        """Get Q-value for a state-action pair."""
+    def get_q(self, state, action: int, context: str = 'combat') -> float:
+        """Get Q-value for a state-action pair.
+
+        States are tuples for combat/base and packed ints for minigames
+        (see MiniGame.get_state); either works as a dict key.
+        """
         q_table = self._get_q_table(context)
         return q_table.get((state, action), 0.0)
 
-    def set_q(self, state: tuple, action: int, value: float, context: str = 'combat'):
+    def set_q(self, state, action: int, value: float, context: str = 'combat'):
         """Set Q-value for a state-action pair."""
         q_table = self._get_q_table(context)
         q_table[(state, action)] = value
 
-    def get_all_q_values(self, state: tuple, context: str = 'combat') -> dict:
+    def get_all_q_values(self, state, context: str = 'combat') -> dict:
         """Get Q-values for all actions in a state."""
         actions = self._get_actions(context)
         return {action: self.get_q(state, action, context) for action in actions}
 
-    def choose_action(self, state: tuple, context: str = 'combat') -> int:
+    def get_q_vector(self, state, context: str = 'combat') -> tuple:
+        """Get Q-values for all actions in a state, in action order.
+
+        Tuple counterpart of get_all_q_values for read-only display
+        paths that don't need a fresh dict per call.
+        """
+        q_table = self._get_q_table(context)
+        return tuple(q_table.get((state, action), 0.0)
+                     for action in self._get_actions(context))
+
+    def choose_action(self, state, context: str = 'combat') -> int:
         """Choose an action using epsilon-greedy policy with guidance effects."""
         actions = self._get_actions(context)
 
@@ -120,7 +134,7 @@ class QLearningAgent:
         self.last_context = context
         return action
 
-    def learn(self, state: tuple, action: int, reward: float, next_state: tuple,
+    def learn(self, state, action: int, reward: float, next_state,
               context: str = 'combat', done: bool = False):
         """Update Q-value using the Q-learning update rule."""
         actions = self._get_actions(context)
@@ -362,29 +376,47 @@ class QLearningAgent:
         self.last_reward = 0.0
         self.cumulative_reward = 0.0
 
-    def get_q_table_dict(self) -> dict:
-        """Convert all Q-tables to serializable dictionary."""
-        data = {
-            'combat': {},
-            'base': {},
-            'minigame': {},
-            'stats': {
-                'total_battles': self.total_battles,
-                'battles_won': self.battles_won,
-                'floors_cleared': self.floors_cleared,
-                'highest_floor': self.highest_floor,
-                'total_learning_updates': self.total_learning_updates,
-                'lessons_learned': self.lessons_learned,
-                'player_taught_actions': self.player_taught_actions
-            }
+    def get_learning_stats(self) -> dict:
+        """Get the persistent learning statistics as a serializable dict."""
+        return {
+            'total_battles': self.total_battles,
+            'battles_won': self.battles_won,
+            'floors_cleared': self.floors_cleared,
+            'highest_floor': self.highest_floor,
+            'total_learning_updates': self.total_learning_updates,
+            'lessons_learned': self.lessons_learned,
+            'player_taught_actions': self.player_taught_actions
         }
 
+    def load_learning_stats(self, stats: dict):
+        """Restore learning statistics from a serialized dict."""
+        self.total_battles = stats.get('total_battles', 0)
+        self.battles_won = stats.get('battles_won', 0)
+        self.floors_cleared = stats.get('floors_cleared', 0)
+        self.highest_floor = stats.get('highest_floor', 0)
+        self.total_learning_updates = stats.get('total_learning_updates', 0)
+        self.lessons_learned = stats.get('lessons_learned', [])
+        self.player_taught_actions = stats.get('player_taught_actions', 0)
+
+    def get_q_table_dict(self) -> dict:
+        """Convert all Q-tables to serializable dictionary.
+
+        Each context is emitted as a flat row list [state, action, value]
+        (state is a list for tuple states, an int for packed minigame
+        states) so loading is one comprehension instead of parsing a
+        stringified tuple key per entry.
+        """
+        data = {'stats': self.get_learning_stats()}
+
         for context, q_table in [('combat', self.combat_q),
                                   ('base', self.base_q),
                                   ('minigame', self.minigame_q)]:
-            for (state, action), value in q_table.items():
-                key = f"{state}:{action}"
-                data[context][key] = value
+            data[context] = {
+                'schema': 'flat',
+                'rows': [[list(state) if isinstance(state, tuple) else state,
+                          action, value]
+                         for (state, action), value in q_table.items()]
+            }
 
         return data
 
@@ -396,25 +428,29 @@ class QLearningAgent:
 
         # Load stats if present
         if 'stats' in data:
-            stats = data['stats']
-            self.total_battles = stats.get('total_battles', 0)
-            self.battles_won = stats.get('battles_won', 0)
-            self.floors_cleared = stats.get('floors_cleared', 0)
-            self.highest_floor = stats.get('highest_floor', 0)
-            self.total_learning_updates = stats.get('total_learning_updates', 0)
-            self.lessons_learned = stats.get('lessons_learned', [])
-            self.player_taught_actions = stats.get('player_taught_actions', 0)
+            self.load_learning_stats(data['stats'])
 
         for context, q_dict in data.items():
             if context == 'stats':
                 continue  # Skip stats, already handled
             q_table = self._get_q_table(context)
+            if q_dict.get('schema') == 'flat':
+                q_table.update(
+                    ((tuple(state) if isinstance(state, list) else state,
+                      action), value)
+                    for state, action, value in q_dict['rows'])
+                continue
+            # Legacy format: stringified "(s0, s1, ...):action" keys
             for key, value in q_dict.items():
                 parts = key.rsplit(':', 1)
                 state_str = parts[0]
                 action = int(parts[1])
-                state_str = state_str.strip('()')
-                state = tuple(int(x.strip()) for x in state_str.split(','))
+                if '(' in state_str or ',' in state_str:
+                    state_str = state_str.strip('()')
+                    state = tuple(int(x.strip()) for x in state_str.split(','))
+                else:
+                    # Packed-int minigame state
+                    state = int(state_str)
                 q_table[(state, action)] = value
 
     @staticmethod
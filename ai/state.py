@@ -101,7 +101,7 @@ class StateEncoder:
         if not alive_enemies:
             return self.ENEMY_NONE, None
 
-        nearest = min(alive_enemies, key=lambda e: agent.distance_to(e))
+        nearest = min(alive_enemies, key=lambda e: agent.distance_sq_to(e))
         enemy_type = self.ENEMY_MELEE if nearest.enemy_type == 'melee' else self.ENEMY_RANGED
 
         return enemy_type, nearest
@@ -114,7 +114,7 @@ class StateEncoder:
             return self.THREAT_LOW
 
         # Count close enemies (within 150 pixels)
-        close_enemies = sum(1 for e in alive_enemies if agent.distance_to(e) < 150)
+        close_enemies = sum(1 for e in alive_enemies if agent.distance_sq_to(e) < 150 * 150)
 
         # Factor in recent damage
         threat_score = close_enemies + (self.recent_damage / 20)
@@ -131,8 +131,8 @@ class StateEncoder:
         if nearest_enemy is None:
             return self.IN_RANGE_NO
 
-        distance = agent.distance_to(nearest_enemy)
-        return self.IN_RANGE_YES if distance <= ATTACK_RANGE else self.IN_RANGE_NO
+        distance_sq = agent.distance_sq_to(nearest_enemy)
+        return self.IN_RANGE_YES if distance_sq <= ATTACK_RANGE * ATTACK_RANGE else self.IN_RANGE_NO
 
     def encode_state(self, agent, enemies: list, terrain_manager=None) -> tuple:
         """Encode the current game state into a discrete tuple.
@@ -1,5 +1,7 @@
 """Game constants and Q-learning hyperparameters."""
 
+import sys
+
 # Screen settings
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -60,10 +62,10 @@ ENEMY_ASSASSIN_DAMAGE_MULT = 2.0
 ENEMY_ASSASSIN_SPEED_MULT = 2.0
 ENEMY_ASSASSIN_FIRST_STRIKE_BONUS = 0.5  # +50% on first hit
 
-# Elements
-ELEMENT_FIRE = 'fire'
-ELEMENT_ICE = 'ice'
-ELEMENT_POISON = 'poison'
+# Elements (interned so hot paths can compare by identity)
+ELEMENT_FIRE = sys.intern('fire')
+ELEMENT_ICE = sys.intern('ice')
+ELEMENT_POISON = sys.intern('poison')
 
 # Status effect durations (frames at 60 FPS)
 BURN_DURATION = 180  # 3 seconds
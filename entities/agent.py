@@ -375,8 +375,6 @@ class Agent(PhysicsBody):
         self.update_dodge()
         self.update_parry()
 
-        # Update status effects (burn, freeze, poison)
-        self.status_effects.update(self)
 
     def is_stunned(self) -> bool:
         """Check if agent is currently stunned."""
@@ -119,9 +119,6 @@ class Enemy(PhysicsBody):
 
     def update(self, agent, terrain_manager=None):
         """Update enemy state each frame."""
-        # Update status effects
-        self.status_effects.update(self)
-
         # Update stun timer
         if self.stunned > 0:
             self.stunned -= 1
@@ -36,6 +36,7 @@ from systems.training import TrainingSystem
 from systems.terrain import TerrainManager
 from systems.persistence import save_game, load_game, save_exists
 from systems.minigames import create_minigame, DeathRollAnimation
+from systems.status_effects import batch_update
 from systems.character import (
     RACES, CLASSES, Equipment, generate_loot,
     apply_race_class_bonuses, get_character_color,
@@ -301,11 +302,11 @@ class Game:
         enemy.element = element
 
         # Update color based on element
-        if element == ELEMENT_FIRE:
+        if element is ELEMENT_FIRE:
             enemy.color = COLOR_FIRE_ENEMY
-        elif element == ELEMENT_ICE:
+        elif element is ELEMENT_ICE:
             enemy.color = COLOR_ICE_ENEMY
-        elif element == ELEMENT_POISON:
+        elif element is ELEMENT_POISON:
             enemy.color = COLOR_POISON_ENEMY
 
     def _spawn_boss(self):
@@ -396,7 +397,7 @@ class Game:
         alive_enemies = [e for e in self.enemies if e.is_alive()]
         if not alive_enemies:
             return
-        nearest = min(alive_enemies, key=lambda e: self.agent.distance_to(e))
+        nearest = min(alive_enemies, key=lambda e: self.agent.distance_sq_to(e))
 
         # Ranged weapons have longer attack range
         attack_range = 200 if self.agent.has_ranged_weapon() else ATTACK_RANGE
@@ -411,8 +412,7 @@ class Game:
             else:  # ACTION_ATTACK_MID or ACTION_ATTACK
                 self.agent.attack_height = 'mid'
 
-            distance = self.agent.distance_to(nearest)
-            if distance > attack_range:
+            if self.agent.distance_sq_to(nearest) > attack_range * attack_range:
                 self.agent.move_toward(nearest.x)
             else:
                 self.agent.vx = 0
@@ -423,8 +423,7 @@ class Game:
             self.agent.move_away_from(nearest.x)
         elif action == ACTION_CHARGE:
             # Rush toward enemy at double speed
-            distance = self.agent.distance_to(nearest)
-            if distance > attack_range:
+            if self.agent.distance_sq_to(nearest) > attack_range * attack_range:
                 direction = 1 if nearest.x > self.agent.x else -1
                 self.agent.vx = direction * AGENT_CHARGE_SPEED
                 self.agent.facing = direction
@@ -460,8 +459,7 @@ class Game:
                 self.agent.jump()
                 # Move toward or away from enemy while jumping
                 if nearest:
-                    distance = self.agent.distance_to(nearest)
-                    if distance < 100:
+                    if self.agent.distance_sq_to(nearest) < 100 * 100:
                         # Too close, jump away
                         self.agent.move_away_from(nearest.x)
                     else:
@@ -552,6 +550,10 @@ class Game:
             if enemy.is_alive():
                 enemy.update(self.agent, self.terrain_manager)
 
+        # Tick status effects (burn, freeze, poison) for all entities in
+        # one vectorized pass instead of per-entity manager updates
+        batch_update([self.agent] + [e for e in self.enemies if e.is_alive()])
+
         # Check for platform landing reward after jump
         if was_in_air and self.agent.grounded:
             # Agent just landed
@@ -1156,7 +1158,16 @@ class Game:
         if self.state in gameplay_states:
             self.renderer.draw_dialogue_box(self.ai_dialogue.get_recent_messages())
 
-        pygame.display.flip()
+        # During conversations the scene behind the overlay is frozen,
+        # so only the overlay's regions need to reach the display
+        if self.state == STATE_CONVERSATION:
+            dirty = self.conversation_ui.get_dirty_rects()
+            if dirty is not None:
+                pygame.display.update(dirty)
+            else:
+                pygame.display.flip()
+        else:
+            pygame.display.flip()
 
     def _render_main_menu(self):
         # Draw custom main menu background
@@ -211,8 +211,7 @@ class CombatSystem:
             if not enemy.is_alive():
                 continue
 
-            distance = agent.distance_to(enemy)
-            if distance <= ATTACK_RANGE:
+            if agent.distance_sq_to(enemy) <= ATTACK_RANGE * ATTACK_RANGE:
                 # Determine body part hit based on attack height
                 body_part = ATTACK_HEIGHT_TO_BODY_PART.get(agent.attack_height, BODY_PART_BODY)
                 damage_mult = BODY_PART_DAMAGE_MULT.get(body_part, 1.0)
@@ -288,8 +287,7 @@ class CombatSystem:
             if not enemy.is_attacking or enemy.attack_timer != 9:
                 continue
 
-            distance = agent.distance_to(enemy)
-            if distance <= ATTACK_RANGE:
+            if agent.distance_sq_to(enemy) <= ATTACK_RANGE * ATTACK_RANGE:
                 # Enemy randomly targets a body part
                 body_part = random.choice([BODY_PART_HEAD, BODY_PART_BODY, BODY_PART_LEGS])
                 damage_mult = BODY_PART_DAMAGE_MULT.get(body_part, 1.0)
@@ -1,6 +1,7 @@
 """Training mini-games that the AI learns to play."""
 
-import random
+import numpy as np
+
 from config import (
     MINIGAME_DURATION_FRAMES,
     REWARD_TRAINING_SUCCESS, REWARD_TRAINING_FAIL, REWARD_MINIGAME_PERFECT,
@@ -8,6 +9,10 @@ from config import (
     DICE_ROLL_FRAMES, DICE_RESULT_DISPLAY_FRAMES, DEATH_ROLL_PENALTY_THRESHOLD
 )
 
+# Shared PCG64 generator for all minigame randomness. Cheaper per call
+# than the stdlib Mersenne Twister and supports batched draws.
+_rng = np.random.default_rng()
+
 
 class MiniGame:
     """Base class for training mini-games."""
@@ -27,8 +32,13 @@ class MiniGame:
         """Update mini-game state. Returns reward if finished."""
         raise NotImplementedError
 
-    def get_state(self) -> tuple:
-        """Get discretized state for Q-learning."""
+    def get_state(self) -> int:
+        """Get discretized state for Q-learning.
+
+        States are packed into a single int (one bitfield per dimension) so
+        Q-table lookups hash one small int instead of a tuple. Each subclass
+        documents its bit layout.
+        """
         raise NotImplementedError
 
     def get_progress(self) -> float:
@@ -72,12 +82,13 @@ class TimingBarGame(MiniGame):
         self.bar_speed = 0.02 + difficulty * 0.008
 
         target_width = max(0.1, 0.18 - difficulty * 0.02)
-        self.target_start = random.uniform(0.25, 0.75 - target_width)
+        self.target_start = float(_rng.uniform(0.25, 0.75 - target_width))
         self.target_end = self.target_start + target_width
 
         perfect_margin = target_width * 0.25
         self.perfect_start = self.target_start + perfect_margin
         self.perfect_end = self.target_end - perfect_margin
+        self.target_center = (self.target_start + self.target_end) * 0.5
 
         self.pressed = False
 
@@ -119,16 +130,17 @@ class TimingBarGame(MiniGame):
             self.success = False
             self.result_message = "Missed! Try to hit the green zone."
 
-    def get_state(self) -> tuple:
+    def get_state(self) -> int:
+        # Bits 0-3: pos_bucket (0-9), bit 4: in_target, bit 5: in_perfect,
+        # bit 6: approaching.
         pos_bucket = min(9, int(self.bar_position * 10))
         in_target = 1 if self.target_start <= self.bar_position <= self.target_end else 0
         in_perfect = 1 if self.perfect_start <= self.bar_position <= self.perfect_end else 0
-        target_center = (self.target_start + self.target_end) / 2
         approaching = 1 if (
-            (self.bar_position < target_center and self.bar_direction > 0) or
-            (self.bar_position > target_center and self.bar_direction < 0)
+            (self.bar_position < self.target_center and self.bar_direction > 0) or
+            (self.bar_position > self.target_center and self.bar_direction < 0)
         ) else 0
-        return (pos_bucket, in_target, in_perfect, approaching)
+        return pos_bucket | (in_target << 4) | (in_perfect << 5) | (approaching << 6)
 
     def get_visual_data(self) -> dict:
         return {
@@ -150,7 +162,7 @@ class ReactionGame(MiniGame):
         super().__init__(stat, difficulty)
         self.game_type = "reaction"
 
-        self.signal_frame = random.randint(40, 90)
+        self.signal_frame = int(_rng.integers(40, 91))
         self.signal_active = False
         self.reaction_time = None
 
@@ -192,14 +204,15 @@ class ReactionGame(MiniGame):
 
         return self.get_reward() if self.finished else 0
 
-    def get_state(self) -> tuple:
+    def get_state(self) -> int:
+        # Bit 0: signal_active, bits 1-3: frames-since-signal bucket (0-5).
         signal_val = 1 if self.signal_active else 0
         if self.signal_active:
             frames_since = self.frame - self.signal_frame
             bucket = min(5, frames_since // 5)
         else:
             bucket = 0
-        return (signal_val, bucket)
+        return signal_val | (bucket << 1)
 
     def get_visual_data(self) -> dict:
         return {
@@ -220,7 +233,7 @@ class BlockGame(MiniGame):
         super().__init__(stat, difficulty)
         self.game_type = "block"
 
-        self.attack_frame = random.randint(30, 70)
+        self.attack_frame = int(_rng.integers(30, 71))
         self.attack_active = False
         self.attack_progress = 0.0
         self.attack_duration = max(40, 60 - difficulty * 5)
@@ -270,11 +283,12 @@ class BlockGame(MiniGame):
 
         return self.get_reward() if self.finished else 0
 
-    def get_state(self) -> tuple:
+    def get_state(self) -> int:
+        # Bit 0: attack_active, bits 1-4: progress_bucket (0-9), bit 5: in_window.
         attack_val = 1 if self.attack_active else 0
         progress_bucket = min(9, int(self.attack_progress * 10))
         in_window = 1 if self.block_window_start <= self.attack_progress <= self.block_window_end else 0
-        return (attack_val, progress_bucket, in_window)
+        return attack_val | (progress_bucket << 1) | (in_window << 5)
 
     def get_visual_data(self) -> dict:
         return {
@@ -303,6 +317,11 @@ class DiceGame(MiniGame):
         self.target = 9 + difficulty
         self.stops_remaining = 3
 
+        # Pre-draw every face the dice could show as one uint8 array, so the
+        # per-frame update is an index instead of a random.randint call.
+        self._roll_table = _rng.integers(
+            1, 7, (self.duration + 1, 3), dtype=np.uint8)
+
     def update(self, action: int = None) -> float:
         if self.finished:
             return 0
@@ -311,7 +330,7 @@ class DiceGame(MiniGame):
 
         for i in range(3):
             if self.rolling[i] and self.frame % self.roll_speed[i] == 0:
-                self.dice[i] = random.randint(1, 6)
+                self.dice[i] = int(self._roll_table[self.frame, i])
 
         if action == ACTION_MINIGAME_PRESS and self.stops_remaining > 0:
             for i in range(3):
@@ -343,11 +362,12 @@ class DiceGame(MiniGame):
             self.success = False
             self.result_message = f"Unlucky... {total} (need {self.target})"
 
-    def get_state(self) -> tuple:
+    def get_state(self) -> int:
+        # Bits 0-2: sum_bucket (0-5), bits 3-4: rolling_count (0-3).
         current_sum = sum(self.dice)
         sum_bucket = min(5, current_sum // 4)
         rolling_count = sum(1 for r in self.rolling if r)
-        return (sum_bucket, rolling_count)
+        return sum_bucket | (rolling_count << 3)
 
     def get_visual_data(self) -> dict:
         return {
@@ -375,12 +395,13 @@ class PatternGame(MiniGame):
         self.bar_speed = 0.008 + difficulty * 0.002  # Much slower than strength
 
         target_width = max(0.1, 0.18 - difficulty * 0.02)
-        self.target_start = random.uniform(0.25, 0.75 - target_width)
+        self.target_start = float(_rng.uniform(0.25, 0.75 - target_width))
         self.target_end = self.target_start + target_width
 
         perfect_margin = target_width * 0.25
         self.perfect_start = self.target_start + perfect_margin
         self.perfect_end = self.target_end - perfect_margin
+        self.target_center = (self.target_start + self.target_end) * 0.5
 
         self.pressed = False
 
@@ -422,16 +443,17 @@ class PatternGame(MiniGame):
             self.success = False
             self.result_message = "Missed! Need more focus."
 
-    def get_state(self) -> tuple:
+    def get_state(self) -> int:
+        # Same layout as TimingBarGame: bits 0-3 pos_bucket, bit 4 in_target,
+        # bit 5 in_perfect, bit 6 approaching.
         pos_bucket = min(9, int(self.bar_position * 10))
         in_target = 1 if self.target_start <= self.bar_position <= self.target_end else 0
         in_perfect = 1 if self.perfect_start <= self.bar_position <= self.perfect_end else 0
-        target_center = (self.target_start + self.target_end) / 2
         approaching = 1 if (
-            (self.bar_position < target_center and self.bar_direction > 0) or
-            (self.bar_position > target_center and self.bar_direction < 0)
+            (self.bar_position < self.target_center and self.bar_direction > 0) or
+            (self.bar_position > self.target_center and self.bar_direction < 0)
         ) else 0
-        return (pos_bucket, in_target, in_perfect, approaching)
+        return pos_bucket | (in_target << 4) | (in_perfect << 5) | (approaching << 6)
 
     def get_visual_data(self) -> dict:
         return {
@@ -444,6 +466,112 @@ class PatternGame(MiniGame):
         }
 
 
+class VectorTimingBar:
+    """A batch of timing-bar games stored as NumPy arrays (one slot per game).
+
+    Stepping B games is a handful of vectorized array ops instead of B
+    separate Python `update` calls, which makes batched RL training rollouts
+    roughly B times cheaper per frame. Covers both TimingBarGame and
+    PatternGame behavior via the bar_speed override.
+    """
+
+    def __init__(self, batch_size: int, difficulty: int = 1,
+                 bar_speed: float = None):
+        self.batch_size = batch_size
+        self.difficulty = difficulty
+        self.frame = 0
+        self.duration = MINIGAME_DURATION_FRAMES
+
+        self.bar_position = np.zeros(batch_size)
+        self.bar_direction = np.ones(batch_size, np.int8)
+        if bar_speed is None:
+            bar_speed = 0.02 + difficulty * 0.008
+        self.bar_speed = bar_speed
+
+        target_width = max(0.1, 0.18 - difficulty * 0.02)
+        self.target_start = _rng.uniform(0.25, 0.75 - target_width, batch_size)
+        self.target_end = self.target_start + target_width
+
+        perfect_margin = target_width * 0.25
+        self.perfect_start = self.target_start + perfect_margin
+        self.perfect_end = self.target_end - perfect_margin
+        self.target_center = (self.target_start + self.target_end) * 0.5
+
+        self.pressed = np.zeros(batch_size, bool)
+        self.finished = np.zeros(batch_size, bool)
+        self.success = np.zeros(batch_size, bool)
+        self.perfect = np.zeros(batch_size, bool)
+
+    def step(self, actions: np.ndarray) -> tuple:
+        """Advance every game one frame.
+
+        Args:
+            actions: int array of shape (batch_size,) with ACTION_MINIGAME_*
+                values, one per game.
+
+        Returns:
+            (rewards, dones) arrays of shape (batch_size,). A reward is
+            non-zero only on the frame its game finishes.
+        """
+        self.frame += 1
+        active = ~self.finished
+
+        self.bar_position += np.where(active, self.bar_direction * self.bar_speed, 0.0)
+        self.bar_direction = np.where(self.bar_position >= 1.0, -1,
+                                      self.bar_direction).astype(np.int8)
+        self.bar_direction = np.where(self.bar_position <= 0.0, 1,
+                                      self.bar_direction).astype(np.int8)
+        np.clip(self.bar_position, 0.0, 1.0, out=self.bar_position)
+
+        press = (actions == ACTION_MINIGAME_PRESS) & ~self.pressed & active
+        self.pressed |= press
+
+        in_target = ((self.bar_position >= self.target_start) &
+                     (self.bar_position <= self.target_end))
+        in_perfect = ((self.bar_position >= self.perfect_start) &
+                      (self.bar_position <= self.perfect_end))
+
+        self.success |= press & in_target
+        self.perfect |= press & in_perfect
+
+        newly_done = press.copy()
+        if self.frame >= self.duration:
+            newly_done |= active & ~self.pressed
+        self.finished |= newly_done
+
+        rewards = np.where(
+            newly_done,
+            np.where(self.perfect, REWARD_MINIGAME_PERFECT,
+                     np.where(self.success, REWARD_TRAINING_SUCCESS,
+                              REWARD_TRAINING_FAIL)),
+            0.0
+        )
+        return rewards, self.finished.copy()
+
+    def get_states(self) -> np.ndarray:
+        """Get packed Q-learning states for all games as a (batch_size,) array.
+
+        Uses the same bit layout as TimingBarGame.get_state(): bits 0-3
+        pos_bucket, bit 4 in_target, bit 5 in_perfect, bit 6 approaching.
+        """
+        pos_bucket = np.minimum(9, (self.bar_position * 10).astype(np.int16))
+        in_target = ((self.bar_position >= self.target_start) &
+                     (self.bar_position <= self.target_end))
+        in_perfect = ((self.bar_position >= self.perfect_start) &
+                      (self.bar_position <= self.perfect_end))
+        approaching = (
+            ((self.bar_position < self.target_center) & (self.bar_direction > 0)) |
+            ((self.bar_position > self.target_center) & (self.bar_direction < 0))
+        )
+        return (pos_bucket |
+                (in_target << 4) |
+                (in_perfect << 5) |
+                (approaching << 6)).astype(np.int16)
+
+    def all_finished(self) -> bool:
+        return bool(self.finished.all())
+
+
 def create_minigame(stat: str, difficulty: int = 1) -> MiniGame:
     """Create a mini-game for the given stat."""
     games = {
@@ -482,7 +610,7 @@ class DeathRollAnimation:
         if self.rolling:
             # Roll animation - change face rapidly
             if self.frame % self.roll_speed == 0:
-                self.current_face = random.randint(1, 6)
+                self.current_face = int(_rng.integers(1, 7))
 
             # Slow down near the end
             if self.frame > self.roll_frames * 0.7:
@@ -493,7 +621,7 @@ class DeathRollAnimation:
             # Stop rolling
             if self.frame >= self.roll_frames:
                 self.rolling = False
-                self.final_result = random.randint(1, 6)
+                self.final_result = int(_rng.integers(1, 7))
                 self.current_face = self.final_result
                 self.frame = 0  # Reset for result display phase
 
@@ -1,11 +1,44 @@
 """Particle system for blood and hit effects."""
 
-import random
+import numpy as np
+
+# Color palettes drawn from at spawn time (module constants so spawn
+# functions don't rebuild the lists per particle).
+_BLOOD_COLORS = (
+    (180, 0, 0),
+    (150, 0, 0),
+    (200, 20, 20),
+    (120, 0, 0),
+    (160, 10, 10)
+)
+_BURN_COLORS = (
+    (255, 100, 0),   # Orange
+    (255, 150, 0),   # Bright orange
+    (255, 50, 0),    # Red-orange
+    (255, 200, 50),  # Yellow-orange
+)
+_FREEZE_COLORS = (
+    (100, 200, 255),  # Light blue
+    (150, 220, 255),  # Lighter blue
+    (200, 240, 255),  # Near white
+    (80, 180, 230),   # Medium blue
+)
+_POISON_COLORS = (
+    (100, 200, 50),   # Green
+    (80, 180, 40),    # Darker green
+    (120, 220, 60),   # Bright green
+    (60, 150, 30),    # Dark green
+)
 
 
 class Particle:
     """A single particle."""
 
+    # No per-instance __dict__: hundreds of particles can be alive at once,
+    # and slot access is faster than dict lookup in the per-frame update.
+    __slots__ = ('x', 'y', 'vx', 'vy', 'color', 'size',
+                 'lifetime', 'max_lifetime', 'active', 'vy_gravity')
+
     def __init__(self, x: float, y: float, vx: float, vy: float,
                  color: tuple, size: int, lifetime: int):
         self.x = x
@@ -17,6 +50,7 @@ class Particle:
         self.lifetime = lifetime
         self.max_lifetime = lifetime
         self.active = True
+        self.vy_gravity = 0.3
 
     def update(self):
         if not self.active:
@@ -26,8 +60,8 @@ class Particle:
         self.x += self.vx
         self.y += self.vy
 
-        # Apply gravity
-        self.vy += 0.3
+        # Apply gravity (per-particle: fire uses negative gravity to rise)
+        self.vy += self.vy_gravity
 
         # Apply friction
         self.vx *= 0.98
@@ -47,6 +81,9 @@ class ParticleSystem:
 
     def __init__(self):
         self.particles = []
+        # PCG64 generator: cheaper per draw than the stdlib Mersenne
+        # Twister and supports batched draws for big bursts.
+        self._rng = np.random.default_rng()
 
     def spawn_blood(self, x: float, y: float, direction: int, amount: int = 10):
         """Spawn blood particles at a position.
@@ -57,33 +94,29 @@ class ParticleSystem:
             direction: Direction of impact (-1 or 1)
             amount: Number of particles
         """
+        rng = self._rng
         for _ in range(amount):
             # Blood colors (various red shades)
-            color = random.choice([
-                (180, 0, 0),
-                (150, 0, 0),
-                (200, 20, 20),
-                (120, 0, 0),
-                (160, 10, 10)
-            ])
+            color = _BLOOD_COLORS[int(rng.integers(0, len(_BLOOD_COLORS)))]
 
             # Random velocity in spray pattern
-            vx = direction * random.uniform(2, 6) + random.uniform(-1, 1)
-            vy = random.uniform(-4, -1)
+            vx = direction * rng.uniform(2, 6) + rng.uniform(-1, 1)
+            vy = rng.uniform(-4, -1)
 
-            size = random.randint(2, 5)
-            lifetime = random.randint(20, 40)
+            size = int(rng.integers(2, 6))
+            lifetime = int(rng.integers(20, 41))
 
             particle = Particle(x, y, vx, vy, color, size, lifetime)
             self.particles.append(particle)
 
     def spawn_hit_effect(self, x: float, y: float, color: tuple = (255, 255, 200)):
         """Spawn a hit spark effect."""
+        rng = self._rng
         for _ in range(5):
-            vx = random.uniform(-3, 3)
-            vy = random.uniform(-3, 3)
-            size = random.randint(2, 4)
-            lifetime = random.randint(5, 15)
+            vx = rng.uniform(-3, 3)
+            vy = rng.uniform(-3, 3)
+            size = int(rng.integers(2, 5))
+            lifetime = int(rng.integers(5, 16))
 
             particle = Particle(x, y, vx, vy, color, size, lifetime)
             self.particles.append(particle)
@@ -93,7 +126,7 @@ class ParticleSystem:
         for i in range(3):
             color = (255, 255, 0)  # Yellow stars
             angle_offset = i * 2.1  # Spread them out
-            vx = random.uniform(-0.5, 0.5)
+            vx = self._rng.uniform(-0.5, 0.5)
             vy = -1
             size = 4
             lifetime = 30
@@ -103,24 +136,20 @@ class ParticleSystem:
 
     def spawn_burn_particles(self, x: float, y: float, amount: int = 5):
         """Spawn fire/burn particles rising from entity."""
+        rng = self._rng
         for _ in range(amount):
-            color = random.choice([
-                (255, 100, 0),   # Orange
-                (255, 150, 0),   # Bright orange
-                (255, 50, 0),    # Red-orange
-                (255, 200, 50),  # Yellow-orange
-            ])
+            color = _BURN_COLORS[int(rng.integers(0, len(_BURN_COLORS)))]
 
             # Fire rises up with some drift
-            vx = random.uniform(-1, 1)
-            vy = random.uniform(-3, -1)  # Upward
+            vx = rng.uniform(-1, 1)
+            vy = rng.uniform(-3, -1)  # Upward
 
-            size = random.randint(3, 6)
-            lifetime = random.randint(15, 30)
+            size = int(rng.integers(3, 7))
+            lifetime = int(rng.integers(15, 31))
 
             # Spawn around the entity
-            spawn_x = x + random.uniform(-10, 10)
-            spawn_y = y - 30 + random.uniform(-10, 10)
+            spawn_x = x + rng.uniform(-10, 10)
+            spawn_y = y - 30 + rng.uniform(-10, 10)
 
             particle = Particle(spawn_x, spawn_y, vx, vy, color, size, lifetime)
             particle.vy_gravity = -0.1  # Fire rises instead of falls
@@ -128,48 +157,40 @@ class ParticleSystem:
 
     def spawn_freeze_particles(self, x: float, y: float, amount: int = 5):
         """Spawn ice/frost particles around entity."""
+        rng = self._rng
         for _ in range(amount):
-            color = random.choice([
-                (100, 200, 255),  # Light blue
-                (150, 220, 255),  # Lighter blue
-                (200, 240, 255),  # Near white
-                (80, 180, 230),   # Medium blue
-            ])
+            color = _FREEZE_COLORS[int(rng.integers(0, len(_FREEZE_COLORS)))]
 
             # Ice drifts slowly outward and down
-            vx = random.uniform(-2, 2)
-            vy = random.uniform(-0.5, 1)
+            vx = rng.uniform(-2, 2)
+            vy = rng.uniform(-0.5, 1)
 
-            size = random.randint(2, 4)
-            lifetime = random.randint(20, 40)
+            size = int(rng.integers(2, 5))
+            lifetime = int(rng.integers(20, 41))
 
             # Spawn around the entity
-            spawn_x = x + random.uniform(-15, 15)
-            spawn_y = y - 30 + random.uniform(-15, 5)
+            spawn_x = x + rng.uniform(-15, 15)
+            spawn_y = y - 30 + rng.uniform(-15, 5)
 
             particle = Particle(spawn_x, spawn_y, vx, vy, color, size, lifetime)
             self.particles.append(particle)
 
     def spawn_poison_particles(self, x: float, y: float, amount: int = 5):
         """Spawn poison/toxic particles bubbling up."""
+        rng = self._rng
         for _ in range(amount):
-            color = random.choice([
-                (100, 200, 50),   # Green
-                (80, 180, 40),    # Darker green
-                (120, 220, 60),   # Bright green
-                (60, 150, 30),    # Dark green
-            ])
+            color = _POISON_COLORS[int(rng.integers(0, len(_POISON_COLORS)))]
 
             # Poison bubbles up with some wobble
-            vx = random.uniform(-1.5, 1.5)
-            vy = random.uniform(-2, -0.5)
+            vx = rng.uniform(-1.5, 1.5)
+            vy = rng.uniform(-2, -0.5)
 
-            size = random.randint(2, 5)
-            lifetime = random.randint(25, 45)
+            size = int(rng.integers(2, 6))
+            lifetime = int(rng.integers(25, 46))
 
             # Spawn around the entity
-            spawn_x = x + random.uniform(-12, 12)
-            spawn_y = y - 25 + random.uniform(-5, 10)
+            spawn_x = x + rng.uniform(-12, 12)
+            spawn_y = y - 25 + rng.uniform(-5, 10)
 
             particle = Particle(spawn_x, spawn_y, vx, vy, color, size, lifetime)
             self.particles.append(particle)
@@ -183,6 +204,23 @@ class ParticleSystem:
         elif element == 'poison':
             self.spawn_poison_particles(x, y, amount)
 
+    def spawn_batch(self, requests: list):
+        """Flush queued (kind, *args) spawn requests in one call.
+
+        Lets per-frame damage loops aggregate their spawns and hand them
+        over in a single call instead of invoking the particle system
+        once per hazard hit.
+        """
+        spawners = self._BATCH_SPAWNERS
+        for req in requests:
+            spawners[req[0]](self, *req[1:])
+
+    _BATCH_SPAWNERS = {
+        'blood': spawn_blood,
+        'burn': spawn_burn_particles,
+        'poison': spawn_poison_particles,
+    }
+
     def update(self):
         """Update all particles."""
         for particle in self.particles:
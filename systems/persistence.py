@@ -1,22 +1,109 @@
 """Save/load functionality for game state."""
 
 import json
+import mmap
 import os
+
+import numpy as np
+
+try:
+    import orjson  # C-accelerated JSON; optional
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard  # optional save compression
+except ImportError:
+    zstandard = None
+
+# First bytes of a zstd frame; used to detect compressed saves on load.
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
 from config import SAVE_FILE, EPSILON_START
 
+# Q-table contexts persisted in the binary sidecar (save version 3+).
+_Q_CONTEXTS = ('combat', 'base', 'minigame')
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialize save data to bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def _loads(payload) -> dict:
+    """Parse save data bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    if isinstance(payload, memoryview):
+        payload = bytes(payload)
+    return json.loads(payload)
+
+
+def _parse_payload(buf) -> dict:
+    """Decompress (if needed) and parse a raw save payload."""
+    if bytes(buf[:4]) == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise RuntimeError(
+                "save file is zstd-compressed but zstandard is not installed")
+        buf = zstandard.ZstdDecompressor().decompress(bytes(buf))
+    return _loads(buf)
+
+
+# Computed once at import: the locations never change at runtime, and
+# save_exists() may be polled every frame from menu code.
+_SAVE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), SAVE_FILE)
+_QTABLE_PATH = _SAVE_PATH + '.qtable.npz'
+
 
 def get_save_path() -> str:
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    return os.path.join(base_dir, SAVE_FILE)
+    return _SAVE_PATH
+
+
+def get_qtable_path() -> str:
+    """Path of the binary Q-table sidecar next to the main save."""
+    return _QTABLE_PATH
+
+
+def _pack_state(state) -> int:
+    """Pack a Q-table state into a uint64 key.
+
+    Byte 0 holds the tuple length (0 means a packed-int minigame state);
+    bytes 1..n hold the tuple elements, which are all small non-negative
+    bucket indices. Packed-int states live in bits 8+.
+    """
+    if isinstance(state, tuple):
+        key = len(state)
+        shift = 8
+        for v in state:
+            key |= int(v) << shift
+            shift += 8
+        return key
+    return int(state) << 8
+
+
+def _unpack_state(key: int):
+    """Inverse of _pack_state."""
+    count = key & 0xFF
+    if count == 0:
+        return key >> 8
+    return tuple((key >> (8 * (i + 1))) & 0xFF for i in range(count))
 
 
 def save_game(agent, q_agent, current_floor: int, extra_data: dict = None) -> bool:
-    """Save game state to file."""
+    """Save game state to file.
+
+    Version 3 keeps stats and metadata in the JSON file and streams the
+    Q-tables into a binary .npz sidecar (packed uint64 state keys, float64
+    values) that loads at memcpy speed instead of string parsing.
+    """
     try:
         save_data = {
-            'version': 2,
+            'version': 3,
             'agent_stats': agent.get_stats_dict(),
-            'q_table': q_agent.get_q_table_dict(),
+            'q_stats': q_agent.get_learning_stats(),
             'epsilon': q_agent.epsilon,
             'current_floor': current_floor
         }
@@ -25,14 +112,64 @@ def save_game(agent, q_agent, current_floor: int, extra_data: dict = None) -> bo
         if extra_data:
             save_data.update(extra_data)
 
+        # Serialize once and write the whole payload in a single call
+        # instead of letting json.dump issue many small writes.
+        payload = _dumps(save_data)
+        if zstandard is not None:
+            # Level 1 trades a little CPU for far fewer bytes on disk;
+            # the Q-table JSON is highly repetitive and compresses well.
+            payload = zstandard.ZstdCompressor(level=1).compress(payload)
+
+        # Q-tables go to the binary sidecar as flat arrays.
+        arrays = {}
+        for context in _Q_CONTEXTS:
+            q_table = q_agent._get_q_table(context)
+            n = len(q_table)
+            keys = np.empty(n, np.uint64)
+            actions = np.empty(n, np.int64)
+            values = np.empty(n, np.float64)
+            for i, ((state, action), value) in enumerate(q_table.items()):
+                keys[i] = _pack_state(state)
+                # last_action is None at episode boundaries and learn()
+                # stores it verbatim; -1 marks those rows (real actions
+                # are non-negative)
+                actions[i] = -1 if action is None else action
+                values[i] = value
+            arrays[context + '_keys'] = keys
+            arrays[context + '_actions'] = actions
+            arrays[context + '_values'] = values
+
+        # The save is only valid as a pair, so both temp files are
+        # written and fsync'd before either replace: a failure anywhere
+        # up to that point leaves the previous save pair untouched
+        # instead of a v3 main file with no sidecar. The sidecar lands
+        # first so the main file never points at data not yet on disk.
         save_path = get_save_path()
-        with open(save_path, 'w') as f:
-            json.dump(save_data, f, indent=2)
+        tmp_path = save_path + '.tmp'
+        qtable_path = get_qtable_path()
+        qtable_tmp = qtable_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        with open(qtable_tmp, 'wb') as f:
+            np.savez(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(qtable_tmp, qtable_path)
+        os.replace(tmp_path, save_path)
 
         return True
 
     except Exception as e:
         print(f"Error saving game: {e}")
+        # Don't leave half-written temp files behind
+        for tmp in (get_save_path() + '.tmp', get_qtable_path() + '.tmp'):
+            try:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            except OSError:
+                pass
         return False
 
 
@@ -44,8 +181,16 @@ def load_game(agent, q_agent) -> dict:
         return None
 
     try:
-        with open(save_path, 'r') as f:
-            save_data = json.load(f)
+        # Parse straight from the page cache: orjson accepts buffer-protocol
+        # objects, so an mmap avoids copying the file through a heap buffer
+        # first. stdlib json can't parse a buffer without copying, so the
+        # fallback stays a single binary read.
+        with open(save_path, 'rb') as f:
+            if orjson is not None:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    save_data = _parse_payload(memoryview(mm))
+            else:
+                save_data = _parse_payload(f.read())
 
         version = save_data.get('version', 1)
 
@@ -53,8 +198,27 @@ def load_game(agent, q_agent) -> dict:
         if 'agent_stats' in save_data:
             agent.load_stats_dict(save_data['agent_stats'])
 
-        # Load Q-table
-        if 'q_table' in save_data:
+        # Load Q-tables: binary sidecar for v3+, JSON dict for older saves
+        if version >= 3:
+            q_agent.load_learning_stats(save_data.get('q_stats', {}))
+            qtable_path = get_qtable_path()
+            if not os.path.exists(qtable_path):
+                # A v3 main file without its sidecar is a torn save;
+                # "loading" it would silently wipe every Q-table
+                raise FileNotFoundError(
+                    f"Q-table sidecar missing: {qtable_path}")
+            with np.load(qtable_path) as data:
+                for context in _Q_CONTEXTS:
+                    q_table = q_agent._get_q_table(context)
+                    q_table.clear()
+                    keys = data[context + '_keys'].tolist()
+                    actions = data[context + '_actions'].tolist()
+                    values = data[context + '_values'].tolist()
+                    for key, action, value in zip(keys, actions, values):
+                        if action == -1:
+                            action = None
+                        q_table[(_unpack_state(key), action)] = value
+        elif 'q_table' in save_data:
             q_table_data = save_data['q_table']
             # Handle both old and new format
             if isinstance(q_table_data, dict):
@@ -86,11 +250,10 @@ def load_game(agent, q_agent) -> dict:
 
 
 def delete_save() -> bool:
-    save_path = get_save_path()
-    if not os.path.exists(save_path):
-        return True
     try:
-        os.remove(save_path)
+        for path in (get_save_path(), get_qtable_path()):
+            if os.path.exists(path):
+                os.remove(path)
         return True
     except Exception as e:
         print(f"Error deleting save: {e}")
@@ -1,10 +1,89 @@
 """Physics system - gravity, knockback, collision detection."""
 
-from config import GRAVITY, GROUND_Y, FRICTION, SCREEN_WIDTH
+from math import sqrt
+
+import numpy as np
+
+from config import (
+    GRAVITY, GROUND_Y, FRICTION, SCREEN_WIDTH,
+    HAZARD_ICE_PATCH, ICE_PATCH_FRICTION
+)
+
+try:
+    from numba import njit  # optional: JIT-compiles the batch step
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _step_kernel(x, y, vx, vy, grounded, half_w,
+                     ice_x0, ice_x1, ice_y,
+                     p_x0, p_x1, p_y, p_active,
+                     left_wall, right_wall, hit_idx):
+        """Integrate all bodies one frame (compiled).
+
+        hit_idx[i] is the landing platform row, -2 for ground, -1 airborne.
+        """
+        for i in range(x.shape[0]):
+            prev_y = y[i]
+            if not grounded[i]:
+                vy[i] += GRAVITY
+            x[i] += vx[i]
+            y[i] += vy[i]
+
+            friction = FRICTION
+            for j in range(ice_x0.shape[0]):
+                if (x[i] + half_w[i] >= ice_x0[j] and
+                        x[i] - half_w[i] <= ice_x1[j] and
+                        abs(y[i] - ice_y[j]) < 20):
+                    friction = ICE_PATCH_FRICTION
+                    break
+            vx[i] *= friction
+            if abs(vx[i]) < 0.1:
+                vx[i] = 0.0
+
+            hit = -1
+            if vy[i] >= 0:
+                for j in range(p_x0.shape[0]):
+                    if (p_active[j] and
+                            x[i] + half_w[i] >= p_x0[j] and
+                            x[i] - half_w[i] <= p_x1[j] and
+                            prev_y <= p_y[j] and y[i] >= p_y[j]):
+                        y[i] = p_y[j]
+                        vy[i] = 0.0
+                        hit = j
+                        break
+            if hit < 0 and y[i] >= GROUND_Y:
+                y[i] = GROUND_Y
+                vy[i] = 0.0
+                hit = -2
+            grounded[i] = hit != -1
+            hit_idx[i] = hit
+
+            left_bound = max(half_w[i], left_wall + half_w[i])
+            right_bound = min(SCREEN_WIDTH - half_w[i], right_wall - half_w[i])
+            x[i] = max(left_bound, min(right_bound, x[i]))
+else:
+    _step_kernel = None
 
 
 class PhysicsBody:
-    """Base class for entities with physics (gravity, knockback, etc.)."""
+    """Base class for entities with physics (gravity, knockback, etc.).
+
+    Defines __slots__ so bare bodies skip the per-instance dict; subclasses
+    like Agent/Enemy don't declare slots, so they still get a __dict__ for
+    their own attributes (including current_platform).
+    """
+
+    __slots__ = ('x', 'y', 'vx', 'vy', 'grounded', 'asleep', 'width',
+                 'height', 'half_width')
+
+    # Collision box is a constant 30px wide; precomputed half-width and
+    # screen bounds keep the per-frame clamp free of repeated division
+    # and builtin min/max calls.
+    _HALF_W = 15
+    _MIN_X = _HALF_W
+    _MAX_X = SCREEN_WIDTH - _HALF_W
 
     def __init__(self, x: float, y: float):
         self.x = x
@@ -12,8 +91,10 @@ class PhysicsBody:
         self.vx = 0.0  # Horizontal velocity
         self.vy = 0.0  # Vertical velocity
         self.grounded = False
+        self.asleep = False  # Settled bodies skip the physics step
         self.width = 30   # Collision box width
         self.height = 60  # Collision box height
+        self.half_width = self.width // 2  # Cached for hot overlap tests
 
     def apply_gravity(self):
         """Apply gravity if not grounded."""
@@ -30,6 +111,7 @@ class PhysicsBody:
         self.vx += direction * force
         self.vy -= force * 0.5  # Pop up slightly
         self.grounded = False
+        self.asleep = False
 
     def update_physics(self, terrain_manager=None):
         """Update position based on velocity and handle ground/platform collision.
@@ -37,6 +119,17 @@ class PhysicsBody:
         Args:
             terrain_manager: Optional TerrainManager for platform collision
         """
+        # Sleeping short-circuit: a grounded, motionless body standing on
+        # something solid has nothing to integrate. Any velocity written by
+        # AI/input code, leaving the ground, or the platform crumbling away
+        # wakes it back up.
+        if self.asleep:
+            if self.vx == 0 and self.vy == 0 and self.grounded:
+                platform = getattr(self, 'current_platform', None)
+                if platform is None or platform.active:
+                    return
+            self.asleep = False
+
         # Store previous y for platform landing detection
         prev_y = self.y
 
@@ -47,12 +140,16 @@ class PhysicsBody:
         self.x += self.vx
         self.y += self.vy
 
+        # Entity extent, used by the spatial-index queries below
+        half_w = self._HALF_W
+        entity_left = self.x - half_w
+        entity_right = self.x + half_w
+
         # Apply friction to horizontal movement
         # Check for ice patch if terrain manager provided
         friction = FRICTION
         if terrain_manager:
-            from config import HAZARD_ICE_PATCH, ICE_PATCH_FRICTION
-            for hazard in terrain_manager.hazards:
+            for hazard in terrain_manager.hazards_near(entity_left, entity_right):
                 if hazard.hazard_type == HAZARD_ICE_PATCH:
                     if hazard.is_entity_in_hazard(self):
                         friction = ICE_PATCH_FRICTION
@@ -68,14 +165,11 @@ class PhysicsBody:
         landed_on_platform = False
 
         if terrain_manager and self.vy >= 0:
-            for platform in terrain_manager.platforms:
+            for platform in terrain_manager.platforms_near(entity_left, entity_right):
                 if not platform.active:
                     continue
 
                 # Check horizontal overlap
-                entity_left = self.x - self.width // 2
-                entity_right = self.x + self.width // 2
-
                 if entity_right < platform.x or entity_left > platform.x + platform.width:
                     continue
 
@@ -99,20 +193,30 @@ class PhysicsBody:
                     self.current_platform = None
 
         # Keep within bounds horizontally (use terrain walls if available)
-        left_bound = self.width // 2
-        right_bound = SCREEN_WIDTH - self.width // 2
+        left_bound = self._MIN_X
+        right_bound = self._MAX_X
 
         if terrain_manager:
             # Use terrain wall boundaries if set
-            left_bound = max(left_bound, terrain_manager.left_wall + self.width // 2)
-            right_bound = min(right_bound, terrain_manager.right_wall - self.width // 2)
+            wall_left = terrain_manager.left_wall + half_w
+            if wall_left > left_bound:
+                left_bound = wall_left
+            wall_right = terrain_manager.right_wall - half_w
+            if wall_right < right_bound:
+                right_bound = wall_right
+
+        if self.x < left_bound:
+            self.x = left_bound
+        elif self.x > right_bound:
+            self.x = right_bound
 
-        self.x = max(left_bound, min(right_bound, self.x))
+        # Fully settled: sleep until something moves us again
+        self.asleep = self.grounded and self.vx == 0 and self.vy == 0
 
     def get_rect(self) -> tuple:
         """Get collision rectangle (left, top, width, height)."""
         return (
-            self.x - self.width // 2,
+            self.x - self.half_width,
             self.y - self.height,
             self.width,
             self.height
@@ -128,16 +232,172 @@ class PhysicsBody:
                 r1[1] < r2[1] + r2[3] and
                 r1[1] + r1[3] > r2[1])
 
-    def distance_to(self, other: 'PhysicsBody') -> float:
-        """Calculate distance to another physics body."""
+    def distance_sq_to(self, other: 'PhysicsBody') -> float:
+        """Squared distance to another body.
+
+        Cheaper than distance_to — prefer this when comparing against a
+        range (compare to range * range) since it skips the sqrt.
+        """
         dx = self.x - other.x
         dy = self.y - other.y
-        return (dx * dx + dy * dy) ** 0.5
+        return dx * dx + dy * dy
+
+    def distance_to(self, other: 'PhysicsBody') -> float:
+        """Calculate distance to another physics body."""
+        return sqrt(self.distance_sq_to(other))
 
     def direction_to(self, other: 'PhysicsBody') -> int:
-        """Get direction to another body (1 = right, -1 = left)."""
-        if other.x > self.x:
-            return 1
-        elif other.x < self.x:
-            return -1
-        return 0
+        """Get direction to another body (1 = right, -1 = left, 0 = same x)."""
+        # Branchless sign: bool subtraction avoids two bytecode jumps in a
+        # per-enemy per-frame call.
+        dx = other.x - self.x
+        return (dx > 0) - (dx < 0)
+
+
+class PhysicsWorld:
+    """Batch physics stepper over many PhysicsBody instances.
+
+    Holds the per-frame state as SoA NumPy arrays and integrates every
+    registered body with vectorized ops, mirroring the semantics of
+    PhysicsBody.update_physics. One array pass replaces N interpreted
+    update calls, which is what batched training simulations need.
+    """
+
+    def __init__(self):
+        self.bodies = []
+
+    def add_body(self, body: PhysicsBody):
+        self.bodies.append(body)
+
+    def remove_body(self, body: PhysicsBody):
+        if body in self.bodies:
+            self.bodies.remove(body)
+
+    def update_all(self, terrain_manager=None):
+        """Step every registered body one frame."""
+        bodies = self.bodies
+        n = len(bodies)
+        if n == 0:
+            return
+
+        x = np.fromiter((b.x for b in bodies), np.float64, n)
+        y = np.fromiter((b.y for b in bodies), np.float64, n)
+        vx = np.fromiter((b.vx for b in bodies), np.float64, n)
+        vy = np.fromiter((b.vy for b in bodies), np.float64, n)
+        grounded = np.fromiter((b.grounded for b in bodies), bool, n)
+        half_w = np.fromiter((b.half_width for b in bodies), np.float64, n)
+
+        if _step_kernel is not None:
+            self._update_all_numba(bodies, x, y, vx, vy, grounded, half_w,
+                                   terrain_manager)
+            return
+
+        prev_y = y.copy()
+
+        # Gravity + integration
+        vy += GRAVITY * ~grounded
+        x += vx
+        y += vy
+
+        # Friction (ice patches reduce it)
+        friction = np.full(n, FRICTION)
+        if terrain_manager:
+            for hazard in terrain_manager.hazards:
+                if hazard.hazard_type != HAZARD_ICE_PATCH or not hazard.active:
+                    continue
+                on_ice = ((x + half_w >= hazard.x) &
+                          (x - half_w <= hazard.x + hazard.width) &
+                          (np.abs(y - hazard.y) < 20))
+                friction[on_ice] = ICE_PATCH_FRICTION
+        vx *= friction
+        vx[np.abs(vx) < 0.1] = 0.0
+
+        # Platform landing (first matching platform in list order, falling
+        # only): one (bodies x platforms) mask against the AABB array, then
+        # argmax picks the first hit per body.
+        grounded[:] = False
+        landed = np.zeros(n, bool)
+        platform_hit = [None] * n
+        if terrain_manager and len(terrain_manager.platform_aabb):
+            aabb = terrain_manager.platform_aabb
+            hits = ((vy >= 0)[:, None] &
+                    (aabb[:, 3] != 0) &
+                    ((x + half_w)[:, None] >= aabb[:, 0]) &
+                    ((x - half_w)[:, None] <= aabb[:, 1]) &
+                    (prev_y[:, None] <= aabb[:, 2]) &
+                    (y[:, None] >= aabb[:, 2]))
+            landed = hits.any(axis=1)
+            first = hits.argmax(axis=1)
+            for i in np.flatnonzero(landed):
+                platform = terrain_manager.platforms[first[i]]
+                y[i] = platform.y
+                vy[i] = 0.0
+                platform_hit[i] = platform
+            grounded |= landed
+
+        # Ground collision fallback
+        on_ground = ~landed & (y >= GROUND_Y)
+        y[on_ground] = GROUND_Y
+        vy[on_ground] = 0.0
+        grounded[on_ground] = True
+
+        # Horizontal bounds
+        left_bound = half_w.copy()
+        right_bound = SCREEN_WIDTH - half_w
+        if terrain_manager:
+            np.maximum(left_bound, terrain_manager.left_wall + half_w, out=left_bound)
+            np.minimum(right_bound, terrain_manager.right_wall - half_w, out=right_bound)
+        np.clip(x, left_bound, right_bound, out=x)
+
+        # Scatter back
+        for i, body in enumerate(bodies):
+            body.x = x[i]
+            body.y = y[i]
+            body.vx = vx[i]
+            body.vy = vy[i]
+            body.grounded = bool(grounded[i])
+            if hasattr(body, 'current_platform'):
+                if landed[i]:
+                    body.current_platform = platform_hit[i]
+                elif on_ground[i]:
+                    body.current_platform = None
+
+    def _update_all_numba(self, bodies, x, y, vx, vy, grounded, half_w,
+                          terrain_manager):
+        """Step bodies through the compiled kernel (numba installed)."""
+        ice = [h for h in (terrain_manager.hazards if terrain_manager else ())
+               if h.active and h.hazard_type == HAZARD_ICE_PATCH]
+        ice_x0 = np.array([h.x for h in ice])
+        ice_x1 = np.array([h.x + h.width for h in ice])
+        ice_y = np.array([h.y for h in ice])
+
+        if terrain_manager and len(terrain_manager.platform_aabb):
+            aabb = terrain_manager.platform_aabb
+            p_x0 = np.ascontiguousarray(aabb[:, 0])
+            p_x1 = np.ascontiguousarray(aabb[:, 1])
+            p_y = np.ascontiguousarray(aabb[:, 2])
+            p_active = np.ascontiguousarray(aabb[:, 3] != 0)
+        else:
+            p_x0 = p_x1 = p_y = np.empty(0)
+            p_active = np.empty(0, bool)
+
+        left_wall = terrain_manager.left_wall if terrain_manager else 0.0
+        right_wall = terrain_manager.right_wall if terrain_manager else float(SCREEN_WIDTH)
+
+        hit_idx = np.empty(len(bodies), np.int64)
+        _step_kernel(x, y, vx, vy, grounded, half_w,
+                     ice_x0, ice_x1, ice_y,
+                     p_x0, p_x1, p_y, p_active,
+                     float(left_wall), float(right_wall), hit_idx)
+
+        for i, body in enumerate(bodies):
+            body.x = x[i]
+            body.y = y[i]
+            body.vx = vx[i]
+            body.vy = vy[i]
+            body.grounded = bool(grounded[i])
+            if hasattr(body, 'current_platform'):
+                if hit_idx[i] >= 0:
+                    body.current_platform = terrain_manager.platforms[hit_idx[i]]
+                elif hit_idx[i] == -2:
+                    body.current_platform = None
@@ -1,5 +1,6 @@
 """Skill system for active and passive abilities."""
 
+import itertools
 import random
 
 # Skill types
@@ -151,6 +152,25 @@ PASSIVE_SKILLS = {
     }
 }
 
+# Minimum floor required before a rarity can drop
+RARITY_MIN_FLOOR = {
+    'common': 1,
+    'uncommon': 1,
+    'rare': 2,
+    'epic': 3,
+    'legendary': 5
+}
+
+# Relative draw weights per rarity; rarer skills roll less often once
+# their floor threshold unlocks them.
+RARITY_WEIGHTS = {
+    'common': 100,
+    'uncommon': 60,
+    'rare': 30,
+    'epic': 12,
+    'legendary': 4
+}
+
 # Rarity colors for display
 SKILL_RARITY_COLORS = {
     'common': (200, 200, 200),
@@ -164,6 +184,9 @@ SKILL_RARITY_COLORS = {
 class Skill:
     """Represents a skill (active or passive)."""
 
+    __slots__ = ('skill_id', 'skill_type', 'data', 'name', 'description',
+                 'rarity', 'cooldown_remaining', 'used_this_floor')
+
     def __init__(self, skill_id: str, skill_type: str):
         self.skill_id = skill_id
         self.skill_type = skill_type
@@ -224,40 +247,56 @@ class Skill:
         return skill
 
 
+def _build_eligible_pools(skills: dict) -> tuple:
+    """Precompute the eligible skill ids for each floor tier.
+
+    The rarity thresholds are static, so the per-call filter loop in
+    generate_random_skill collapses to a tuple index. Tier N holds every
+    skill whose rarity is unlocked by floor N; tier 5 unlocks everything.
+    """
+    return tuple(
+        tuple(sid for sid, sd in skills.items()
+              if RARITY_MIN_FLOOR[sd['rarity']] <= max(tier, 1))
+        for tier in range(6)
+    )
+
+
+ELIGIBLE_ACTIVE = _build_eligible_pools(ACTIVE_SKILLS)
+ELIGIBLE_PASSIVE = _build_eligible_pools(PASSIVE_SKILLS)
+
+
+def _build_weighted_pools(skills: dict, eligible_pools: tuple) -> tuple:
+    """Pair each tier's eligible pool with cumulative rarity weights.
+
+    random.choices with precomputed cum_weights is a single C-level
+    binary search per draw, and it weights the draw by rarity instead of
+    treating a legendary like an uncommon once both are unlocked.
+    """
+    pools = []
+    for eligible in eligible_pools:
+        cum_weights = list(itertools.accumulate(
+            RARITY_WEIGHTS[skills[sid]['rarity']] for sid in eligible))
+        pools.append((eligible, cum_weights))
+    return tuple(pools)
+
+
+WEIGHTED_ACTIVE = _build_weighted_pools(ACTIVE_SKILLS, ELIGIBLE_ACTIVE)
+WEIGHTED_PASSIVE = _build_weighted_pools(PASSIVE_SKILLS, ELIGIBLE_PASSIVE)
+
+
 def generate_random_skill(floor_level: int) -> Skill:
-    """Generate a random skill based on floor level."""
+    """Generate a random skill based on floor level, weighted by rarity."""
     # 50/50 active vs passive
     if random.random() < 0.5:
         skill_type = SKILL_TYPE_ACTIVE
-        skills = ACTIVE_SKILLS
+        pools = WEIGHTED_ACTIVE
     else:
         skill_type = SKILL_TYPE_PASSIVE
-        skills = PASSIVE_SKILLS
-
-    # Filter by rarity based on floor
-    eligible_skills = []
-    for skill_id, skill_data in skills.items():
-        rarity = skill_data['rarity']
-        # Legendary requires floor 5+
-        if rarity == 'legendary' and floor_level < 5:
-            continue
-        # Epic requires floor 3+
-        if rarity == 'epic' and floor_level < 3:
-            continue
-        # Rare requires floor 2+
-        if rarity == 'rare' and floor_level < 2:
-            continue
-        eligible_skills.append(skill_id)
-
-    if not eligible_skills:
-        # Fallback to any uncommon/common skill
-        eligible_skills = [
-            sid for sid, sd in skills.items()
-            if sd['rarity'] in ['common', 'uncommon']
-        ]
+        pools = WEIGHTED_PASSIVE
 
+    eligible_skills, cum_weights = pools[min(floor_level, 5)]
     if eligible_skills:
-        chosen_id = random.choice(eligible_skills)
+        chosen_id = random.choices(eligible_skills, cum_weights=cum_weights)[0]
         return Skill(chosen_id, skill_type)
 
     return None
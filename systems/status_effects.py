@@ -1,5 +1,7 @@
 """Status effect system for elemental damage types."""
 
+import numpy as np
+
 from config import (
     ELEMENT_FIRE, ELEMENT_ICE, ELEMENT_POISON,
     BURN_DURATION, BURN_TICK_DAMAGE, BURN_TICK_INTERVAL,
@@ -11,6 +13,8 @@ from config import (
 class StatusEffect:
     """Base class for status effects."""
 
+    __slots__ = ('effect_type', 'duration', 'remaining')
+
     def __init__(self, effect_type: str, duration: int):
         self.effect_type = effect_type
         self.duration = duration
@@ -30,26 +34,43 @@ class StatusEffect:
         pass
 
 
-class BurnEffect(StatusEffect):
-    """Fire damage over time."""
+class DotEffect(StatusEffect):
+    """Damage-over-time effect; burn and poison differ only in constants."""
 
-    def __init__(self, duration: int = BURN_DURATION):
-        super().__init__(ELEMENT_FIRE, duration)
+    __slots__ = ('tick_counter', 'tick_interval', 'tick_damage')
+
+    def __init__(self, effect_type: str, duration: int,
+                 tick_interval: int, tick_damage: int):
+        super().__init__(effect_type, duration)
         self.tick_counter = 0
+        self.tick_interval = tick_interval
+        self.tick_damage = tick_damage
 
     def update(self, target) -> bool:
         self.tick_counter += 1
-        if self.tick_counter >= BURN_TICK_INTERVAL:
+        if self.tick_counter >= self.tick_interval:
             self.tick_counter = 0
             # Direct HP reduction (bypasses defense)
-            target.hp -= BURN_TICK_DAMAGE
+            target.hp -= self.tick_damage
             target.hp = max(0, target.hp)
         return super().update(target)
 
 
+class BurnEffect(DotEffect):
+    """Fire damage over time."""
+
+    __slots__ = ()
+
+    def __init__(self, duration: int = BURN_DURATION):
+        super().__init__(ELEMENT_FIRE, duration,
+                         BURN_TICK_INTERVAL, BURN_TICK_DAMAGE)
+
+
 class FreezeEffect(StatusEffect):
     """Slow movement speed."""
 
+    __slots__ = ('original_speed',)
+
     def __init__(self, duration: int = FREEZE_DURATION):
         super().__init__(ELEMENT_ICE, duration)
         self.original_speed = None
@@ -63,81 +84,146 @@ class FreezeEffect(StatusEffect):
             target.speed = self.original_speed
 
 
-class PoisonEffect(StatusEffect):
+class PoisonEffect(DotEffect):
     """Poison damage over time (longer duration, lower damage)."""
 
-    def __init__(self, duration: int = POISON_DURATION):
-        super().__init__(ELEMENT_POISON, duration)
-        self.tick_counter = 0
+    __slots__ = ()
 
-    def update(self, target) -> bool:
-        self.tick_counter += 1
-        if self.tick_counter >= POISON_TICK_INTERVAL:
-            self.tick_counter = 0
-            # Direct HP reduction (bypasses defense)
-            target.hp -= POISON_TICK_DAMAGE
-            target.hp = max(0, target.hp)
-        return super().update(target)
+    def __init__(self, duration: int = POISON_DURATION):
+        super().__init__(ELEMENT_POISON, duration,
+                         POISON_TICK_INTERVAL, POISON_TICK_DAMAGE)
 
 
 class StatusEffectManager:
-    """Manages status effects on a target."""
+    """Manages status effects on a target.
+
+    Effects never stack, so there is at most one per type; they are kept
+    in a dict keyed by effect_type for O(1) lookup instead of scanning a
+    list on every hit check.
+    """
+
+    __slots__ = ('effects',)
 
     def __init__(self):
-        self.effects = []
+        self.effects = {}
 
     def add_effect(self, effect: StatusEffect, target):
         """Add a status effect. Refreshes duration if already exists."""
-        # Check for existing effect of same type
-        for existing in self.effects:
-            if existing.effect_type == effect.effect_type:
-                # Refresh duration instead of stacking
-                existing.remaining = effect.duration
-                return
+        existing = self.effects.get(effect.effect_type)
+        if existing is not None:
+            # Refresh duration instead of stacking
+            existing.remaining = effect.duration
+            return
 
         # New effect
         effect.on_apply(target)
-        self.effects.append(effect)
+        self.effects[effect.effect_type] = effect
 
     def update(self, target):
         """Update all effects. Removes expired ones."""
-        expired = []
-        for effect in self.effects:
+        expired = None
+        for effect in self.effects.values():
             if effect.update(target):
+                if expired is None:
+                    expired = []
                 expired.append(effect)
 
-        for effect in expired:
-            effect.on_remove(target)
-            self.effects.remove(effect)
+        if expired:
+            for effect in expired:
+                effect.on_remove(target)
+                del self.effects[effect.effect_type]
 
     def has_effect(self, effect_type: str) -> bool:
         """Check if target has a specific effect type."""
-        return any(e.effect_type == effect_type for e in self.effects)
+        return effect_type in self.effects
 
     def get_effect(self, effect_type: str) -> StatusEffect:
         """Get effect by type, or None."""
-        for effect in self.effects:
-            if effect.effect_type == effect_type:
-                return effect
-        return None
+        return self.effects.get(effect_type)
 
     def clear(self):
         """Remove all effects without calling on_remove."""
-        self.effects = []
+        self.effects = {}
 
     def clear_with_removal(self, target):
         """Remove all effects, calling on_remove for each."""
-        for effect in self.effects:
+        for effect in self.effects.values():
             effect.on_remove(target)
-        self.effects = []
+        self.effects = {}
+
+
+def batch_update(targets):
+    """Tick status effects for every entity in one pass.
+
+    DoT effects across all targets are stepped through shared NumPy
+    arrays — one vector op per field instead of one Python frame per
+    effect. Non-DoT effects (freeze) keep their scalar update since they
+    carry per-target apply/remove hooks and there is at most one each.
+    """
+    dot_effects = []
+    dot_owner = []  # (manager, target index) per DoT effect
+    for ti, target in enumerate(targets):
+        manager = target.status_effects
+        if not manager.effects:
+            continue
+        scalar_expired = None
+        for effect in manager.effects.values():
+            if isinstance(effect, DotEffect):
+                dot_effects.append(effect)
+                dot_owner.append((manager, ti))
+            elif effect.update(target):
+                if scalar_expired is None:
+                    scalar_expired = []
+                scalar_expired.append(effect)
+        if scalar_expired:
+            for effect in scalar_expired:
+                effect.on_remove(target)
+                del manager.effects[effect.effect_type]
+
+    n = len(dot_effects)
+    if n == 0:
+        return
+
+    tick = np.fromiter((e.tick_counter for e in dot_effects), np.int32, n)
+    interval = np.fromiter((e.tick_interval for e in dot_effects), np.int32, n)
+    damage = np.fromiter((e.tick_damage for e in dot_effects), np.int32, n)
+    remaining = np.fromiter((e.remaining for e in dot_effects), np.int32, n)
+
+    tick += 1
+    fired = tick >= interval
+    tick[fired] = 0
+    remaining -= 1
+
+    # Scatter damage per target (a target can hold burn and poison at once)
+    owner_idx = np.fromiter((ti for _m, ti in dot_owner), np.int32, n)
+    hp = np.fromiter((t.hp for t in targets), np.float64, len(targets))
+    np.subtract.at(hp, owner_idx[fired], damage[fired])
+    np.maximum(hp, 0, out=hp)
+    for i in np.nonzero(fired)[0]:
+        target = targets[dot_owner[i][1]]
+        target.hp = type(target.hp)(hp[dot_owner[i][1]])
+
+    # Write tick state back and drop expired effects
+    tick_list = tick.tolist()
+    remaining_list = remaining.tolist()
+    for i, effect in enumerate(dot_effects):
+        effect.tick_counter = tick_list[i]
+        effect.remaining = remaining_list[i]
+        if remaining_list[i] <= 0:
+            manager, ti = dot_owner[i]
+            effect.on_remove(targets[ti])
+            del manager.effects[effect.effect_type]
+
+
+# Table-driven dispatch: one dict hash per hit instead of an if/elif chain.
+_EFFECT_CTOR = {
+    ELEMENT_FIRE: BurnEffect,
+    ELEMENT_ICE: FreezeEffect,
+    ELEMENT_POISON: PoisonEffect
+}
 
 
 def create_effect(element: str) -> StatusEffect:
     """Factory function to create status effect from element type."""
-    if element == ELEMENT_FIRE:
-        return BurnEffect()
-    elif element == ELEMENT_ICE:
-        return FreezeEffect()
-    elif element == ELEMENT_POISON:
-        return PoisonEffect()
-    return None
+    ctor = _EFFECT_CTOR.get(element)
+    return ctor() if ctor is not None else None
@@ -1,6 +1,13 @@
 """Terrain system for platforms and hazards."""
 
 import random
+
+import numpy as np
+
+try:
+    from numba import njit  # optional: JIT-compiles the overlap predicates
+except ImportError:
+    njit = None
 from config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_Y,
     PLATFORM_WOODEN, PLATFORM_STONE, PLATFORM_CRUMBLING,
@@ -11,15 +18,53 @@ from config import (
     LAVA_DAMAGE_PER_FRAME, SPIKE_DAMAGE, SPIKE_COOLDOWN,
     FIRE_GEYSER_DAMAGE, FIRE_GEYSER_INTERVAL, FIRE_GEYSER_DURATION,
     HAZARD_MIN_WIDTH, HAZARD_MAX_WIDTH,
-    ELEMENT_POISON
+    ELEMENT_POISON, ELEMENT_ICE, BOSS_FLOOR_INTERVAL
 )
 from systems.status_effects import create_effect
-from stages import get_stage, TILE_SIZE
+from stages import get_stage, TILE_STAGES, TILE_SIZE
+
+# Width of the x-axis buckets in the terrain spatial index. Physics queries
+# touch only the buckets an entity overlaps instead of every object.
+BUCKET_WIDTH = 128
+
+_EMPTY = ()
+
+# Module-level generator (PCG64): bulk draws for floor generation
+_rng = np.random.default_rng()
+
+
+def _on_platform_check(ex, ey, half_w, grounded, px, py, pw):
+    """Scalar overlap math for Platform.is_entity_on_platform.
+
+    Written as one branchless boolean expression: the bitwise ands
+    evaluate without short-circuit jumps, so there are no data-dependent
+    branches for the interpreter (or numba's codegen) to mispredict.
+    """
+    return ((ex + half_w >= px) & (ex - half_w <= px + pw)
+            & (abs(ey - py) < 5) & grounded)
+
+
+def _in_hazard_check(ex, ey, half_w, hx, hy, hw, is_geyser, geyser_active):
+    """Scalar overlap math for Hazard.is_entity_in_hazard."""
+    overlap = (ex + half_w >= hx) & (ex - half_w <= hx + hw)
+    if is_geyser:
+        # Geyser affects a tall column when erupting
+        return overlap & geyser_active & (ey > hy - 100) & (ey <= hy)
+    # Ground-level hazards
+    return overlap & (abs(ey - hy) < 20)
+
+
+if njit is not None:
+    _on_platform_check = njit(cache=True)(_on_platform_check)
+    _in_hazard_check = njit(cache=True)(_in_hazard_check)
 
 
 class Platform:
     """A platform that entities can stand on."""
 
+    __slots__ = ('x', 'y', 'width', 'height', 'platform_type', 'active',
+                 'crumble_timer', 'entity_on_platform', '_right')
+
     def __init__(self, x: float, y: float, width: int, platform_type: str = PLATFORM_WOODEN):
         self.x = x
         self.y = y
@@ -27,6 +72,7 @@ class Platform:
         self.height = PLATFORM_HEIGHT
         self.platform_type = platform_type
         self.active = True
+        self._right = x + width  # Platforms never move
 
         # Crumbling platform state
         self.crumble_timer = 0
@@ -41,29 +87,29 @@ class Platform:
         if not self.active:
             return False
 
-        # Check horizontal overlap
-        entity_left = entity.x - entity.width // 2
-        entity_right = entity.x + entity.width // 2
-
-        if entity_right < self.x or entity_left > self.x + self.width:
-            return False
+        return _on_platform_check(
+            entity.x, entity.y, entity.half_width, entity.grounded,
+            self.x, self.y, self.width)
 
-        # Check if entity feet are at platform level (with small tolerance)
-        return abs(entity.y - self.y) < 5 and entity.grounded
+    def update(self, entities: list = None, entity_on: bool = None):
+        """Update platform state.
 
-    def update(self, entities: list = None):
-        """Update platform state."""
+        entity_on may be precomputed by the caller (TerrainManager does
+        one vectorized occupancy pass over all entities); when omitted,
+        the per-entity scan runs here.
+        """
         if not self.active:
             return
 
         if self.platform_type == PLATFORM_CRUMBLING:
             # Check if any entity is on the platform
-            entity_on = False
-            if entities:
-                for entity in entities:
-                    if self.is_entity_on_platform(entity):
-                        entity_on = True
-                        break
+            if entity_on is None:
+                entity_on = False
+                if entities:
+                    for entity in entities:
+                        if self.is_entity_on_platform(entity):
+                            entity_on = True
+                            break
 
             if entity_on:
                 self.entity_on_platform = True
@@ -80,6 +126,10 @@ class Platform:
 class Hazard:
     """Environmental hazard that damages entities."""
 
+    __slots__ = ('x', 'y', 'width', 'height', 'hazard_type', 'active',
+                 'geyser_timer', 'geyser_active', '_rect', '_right',
+                 '_is_geyser')
+
     def __init__(self, x: float, y: float, width: int, hazard_type: str):
         self.x = x
         self.y = y
@@ -87,43 +137,36 @@ class Hazard:
         self.height = 15  # Visual height
         self.hazard_type = hazard_type
         self.active = True
+        self._is_geyser = hazard_type == HAZARD_FIRE_GEYSER
 
         # Fire geyser state
         self.geyser_timer = random.randint(0, FIRE_GEYSER_INTERVAL)  # Stagger eruptions
         self.geyser_active = False
 
-        # Spike cooldown tracking per entity
-        self.spike_cooldowns = {}  # entity_id -> frames remaining
+        # Hazards never move, so the collision rect and right edge are
+        # built once
+        self._rect = (x, y - self.height, width, self.height)
+        self._right = x + width
 
     def get_rect(self) -> tuple:
         """Return (x, y, width, height) for collision."""
-        return (self.x, self.y - self.height, self.width, self.height)
+        return self._rect
 
     def is_entity_in_hazard(self, entity) -> bool:
         """Check if an entity is in the hazard zone."""
-        if not self.active:
+        # Cheapest rejects first: dormant geysers (most frames) skip
+        # the overlap arithmetic entirely
+        if not self.active or (self._is_geyser and not self.geyser_active):
             return False
 
-        # Check horizontal overlap
-        entity_left = entity.x - entity.width // 2
-        entity_right = entity.x + entity.width // 2
-
-        if entity_right < self.x or entity_left > self.x + self.width:
-            return False
-
-        # Check vertical - entity feet near hazard level
-        if self.hazard_type == HAZARD_FIRE_GEYSER:
-            # Geyser affects a tall column when active
-            if self.geyser_active:
-                return entity.y > self.y - 100 and entity.y <= self.y
-            return False
-        else:
-            # Ground-level hazards
-            return abs(entity.y - self.y) < 20
+        return _in_hazard_check(
+            entity.x, entity.y, entity.half_width,
+            self.x, self.y, self.width,
+            self._is_geyser, self.geyser_active)
 
     def update(self):
         """Update hazard state (timers, etc.)."""
-        if self.hazard_type == HAZARD_FIRE_GEYSER:
+        if self._is_geyser:
             self.geyser_timer += 1
             if self.geyser_active:
                 if self.geyser_timer >= FIRE_GEYSER_DURATION:
@@ -134,64 +177,213 @@ class Hazard:
                     self.geyser_active = True
                     self.geyser_timer = 0
 
-        # Update spike cooldowns
-        for entity_id in list(self.spike_cooldowns.keys()):
-            self.spike_cooldowns[entity_id] -= 1
-            if self.spike_cooldowns[entity_id] <= 0:
-                del self.spike_cooldowns[entity_id]
 
-    def apply_effect(self, entity, particle_system=None) -> int:
-        """Apply hazard effect to entity. Returns damage dealt."""
+    def apply_effect(self, entity, particle_system=None,
+                     frame: int = 0) -> int:
+        """Apply hazard effect to entity. Returns damage dealt.
+
+        frame is the caller's frame counter, which spike cooldowns are
+        stamped against. Dispatch goes through a per-type handler table
+        instead of an if/elif chain of string compares.
+        """
         if not self.is_entity_in_hazard(entity):
             return 0
 
-        damage = 0
-
-        if self.hazard_type == HAZARD_LAVA:
-            damage = LAVA_DAMAGE_PER_FRAME
-            entity.hp -= damage
-            entity.hp = max(0, entity.hp)
-            if particle_system:
-                particle_system.spawn_burn_particles(entity.x, entity.y, 2)
-
-        elif self.hazard_type == HAZARD_SPIKES:
-            entity_id = id(entity)
-            if entity_id not in self.spike_cooldowns:
-                damage = SPIKE_DAMAGE
-                actual = entity.take_damage(damage)
-                self.spike_cooldowns[entity_id] = SPIKE_COOLDOWN
-                # Knockback up
-                entity.vy = -8
-                entity.grounded = False
-                if particle_system:
-                    particle_system.spawn_blood(entity.x, entity.y, 1, 5)
-                return actual
-
-        elif self.hazard_type == HAZARD_POISON_POOL:
-            effect = create_effect(ELEMENT_POISON)
-            if effect and hasattr(entity, 'status_effects'):
-                entity.status_effects.add_effect(effect, entity)
-            if particle_system:
-                particle_system.spawn_poison_particles(entity.x, entity.y, 2)
-
-        elif self.hazard_type == HAZARD_FIRE_GEYSER:
-            if self.geyser_active:
-                damage = FIRE_GEYSER_DAMAGE
-                entity.take_damage(damage)
-                entity.vy = -15  # Launch upward
-                entity.grounded = False
-                if particle_system:
-                    particle_system.spawn_burn_particles(entity.x, entity.y, 10)
-
-        elif self.hazard_type == HAZARD_ICE_PATCH:
-            # Ice patch applies freeze effect
-            from config import ELEMENT_ICE
-            effect = create_effect(ELEMENT_ICE)
-            if effect and hasattr(entity, 'status_effects'):
-                entity.status_effects.add_effect(effect, entity)
+        return self._HAZARD_APPLIERS[self.hazard_type](
+            self, entity, particle_system, frame)
+
+    def _apply_lava(self, entity, particle_system, frame) -> int:
+        damage = LAVA_DAMAGE_PER_FRAME
+        entity.hp -= damage
+        entity.hp = max(0, entity.hp)
+        if particle_system:
+            particle_system.spawn_burn_particles(entity.x, entity.y, 2)
+        return damage
 
+    def _apply_spikes(self, entity, particle_system, frame) -> int:
+        # Re-arm frame lives on the entity itself, so the cooldown
+        # follows it regardless of list order or which spike hit it
+        if frame < getattr(entity, '_next_spike_frame', 0):
+            return 0
+        actual = entity.take_damage(SPIKE_DAMAGE)
+        entity._next_spike_frame = frame + SPIKE_COOLDOWN
+        # Knockback up
+        entity.vy = -8
+        entity.grounded = False
+        if particle_system:
+            particle_system.spawn_blood(entity.x, entity.y, 1, 5)
+        return actual
+
+    def _apply_poison_pool(self, entity, particle_system, frame) -> int:
+        effect = create_effect(ELEMENT_POISON)
+        if effect and hasattr(entity, 'status_effects'):
+            entity.status_effects.add_effect(effect, entity)
+        if particle_system:
+            particle_system.spawn_poison_particles(entity.x, entity.y, 2)
+        return 0
+
+    def _apply_fire_geyser(self, entity, particle_system, frame) -> int:
+        if not self.geyser_active:
+            return 0
+        damage = FIRE_GEYSER_DAMAGE
+        entity.take_damage(damage)
+        entity.vy = -15  # Launch upward
+        entity.grounded = False
+        if particle_system:
+            particle_system.spawn_burn_particles(entity.x, entity.y, 10)
         return damage
 
+    def _apply_ice_patch(self, entity, particle_system, frame) -> int:
+        # Ice patch applies freeze effect
+        effect = create_effect(ELEMENT_ICE)
+        if effect and hasattr(entity, 'status_effects'):
+            entity.status_effects.add_effect(effect, entity)
+        return 0
+
+    _HAZARD_APPLIERS = {
+        HAZARD_LAVA: _apply_lava,
+        HAZARD_SPIKES: _apply_spikes,
+        HAZARD_POISON_POOL: _apply_poison_pool,
+        HAZARD_FIRE_GEYSER: _apply_fire_geyser,
+        HAZARD_ICE_PATCH: _apply_ice_patch,
+    }
+
+
+
+def _parse_tilemap(tile_map: list) -> dict:
+    """Parse a tile-map string grid into a terrain template.
+
+    Returns plain tuples (platform/hazard geometry, walls, spawns) so
+    repeat visits to a floor skip the per-character scan entirely. The
+    grid is scanned as a NumPy character array: block runs fall out of
+    a diff over the per-row 'B' mask and spawn/hazard cells out of
+    argwhere, so no Python-level per-cell loop runs.
+    """
+    map_height = len(tile_map)
+    map_width = len(tile_map[0]) if tile_map else 0
+
+    tile_w = SCREEN_WIDTH // map_width
+    tile_h = SCREEN_HEIGHT // map_height
+
+    grid = np.array([list(row) for row in tile_map], dtype='U1')
+
+    left_wall = 0
+    right_wall = SCREEN_WIDTH
+
+    # Find wall boundaries (leftmost and rightmost empty space)
+    # Look at a middle row to find where the walls are
+    middle_row = map_height // 2
+    if middle_row < map_height:
+        open_cols = np.nonzero(grid[middle_row] != 'B')[0]
+        if open_cols.size:
+            left_wall = int(open_cols[0]) * tile_w
+            right_wall = (int(open_cols[-1]) + 1) * tile_w
+
+    # Find the floor row (last row with B's) to calculate Y offset
+    # This maps tile Y coordinates to game's GROUND_Y
+    floor_row = map_height - 1  # Assume bottom row is floor
+    y_offset = GROUND_Y - (floor_row * tile_h)
+
+    # Horizontal 'B' runs become platforms: a zero-padded diff over the
+    # block mask marks each run's start (+1) and end (-1) column, and
+    # argwhere yields them row-major so starts and ends pair up in order
+    block_mask = (grid == 'B').astype(np.int8)
+    pad = np.zeros((map_height, 1), np.int8)
+    edges = np.diff(np.concatenate((pad, block_mask, pad), axis=1), axis=1)
+    run_starts = np.argwhere(edges == 1)
+    run_ends = np.argwhere(edges == -1)
+
+    xs = run_starts[:, 1] * tile_w
+    ys = run_starts[:, 0] * tile_h + y_offset
+    widths = (run_ends[:, 1] - run_starts[:, 1]) * tile_w
+    # Only keep platforms that aren't full-width (floor/ceiling/walls)
+    keep = widths < SCREEN_WIDTH - tile_w * 2
+    platforms = tuple(zip(xs[keep].tolist(), ys[keep].tolist(),
+                          widths[keep].tolist()))
+
+    # Hazard cells - create spikes
+    hazards = tuple(
+        (int(col) * tile_w, GROUND_Y, tile_w, HAZARD_SPIKES)
+        for col in np.argwhere(grid == 'H')[:, 1])
+
+    # Player spawn - place feet at GROUND_Y level (last marker wins)
+    player_spawn = None
+    p_cells = np.argwhere(grid == 'P')
+    if p_cells.size:
+        player_spawn = (int(p_cells[-1, 1]) * tile_w + tile_w // 2, GROUND_Y)
+
+    # Enemy spawns (generic/melee/ranged)
+    enemy_mask = (grid == 'E') | (grid == 'M') | (grid == 'R')
+    enemy_spawns = tuple(
+        (int(col) * tile_w + tile_w // 2, GROUND_Y)
+        for col in np.argwhere(enemy_mask)[:, 1])
+
+    return {
+        'left_wall': left_wall,
+        'right_wall': right_wall,
+        'platforms': platforms,
+        'hazards': hazards,
+        'player_spawn': player_spawn,
+        'enemy_spawns': enemy_spawns,
+    }
+
+
+# Stage layouts are constants; parse each one exactly once at import
+_TILEMAP_TEMPLATES = {id(stage): _parse_tilemap(stage)
+                      for stage in TILE_STAGES.values()}
+
+
+class _ParticleQueue:
+    """Collects hazard particle requests for one spawn_batch flush."""
+
+    __slots__ = ('requests',)
+
+    def __init__(self):
+        self.requests = []
+
+    def spawn_blood(self, x, y, direction, amount=10):
+        self.requests.append(('blood', x, y, direction, amount))
+
+    def spawn_burn_particles(self, x, y, amount=5):
+        self.requests.append(('burn', x, y, amount))
+
+    def spawn_poison_particles(self, x, y, amount=5):
+        self.requests.append(('poison', x, y, amount))
+
+# Boss floor layouts, keyed by boss index (floor // BOSS_FLOOR_INTERVAL);
+# parameter tuples are (x, y, width, type) for hazards and platforms.
+BOSS_TERRAIN = {
+    1: (  # Floor 5 - Inferno Guardian: lava pools, some platforms for safety
+        ((100, GROUND_Y, 80, HAZARD_LAVA),
+         (500, GROUND_Y, 80, HAZARD_LAVA),
+         (300, GROUND_Y, 60, HAZARD_FIRE_GEYSER)),
+        ((200, 350, 150, PLATFORM_STONE),
+         (450, 300, 120, PLATFORM_STONE)),
+    ),
+    2: (  # Floor 10 - Frost Warden: ice patches, elevated platforms
+        ((100, GROUND_Y, 150, HAZARD_ICE_PATCH),
+         (400, GROUND_Y, 150, HAZARD_ICE_PATCH)),
+        ((100, 320, 120, PLATFORM_STONE),
+         (350, 250, 150, PLATFORM_STONE),
+         (550, 320, 120, PLATFORM_STONE)),
+    ),
+    3: (  # Floor 15 - Plague Lord: poison pools, crumbling platforms
+        ((150, GROUND_Y, 120, HAZARD_POISON_POOL),
+         (450, GROUND_Y, 120, HAZARD_POISON_POOL)),
+        ((100, 350, 100, PLATFORM_WOODEN),
+         (300, 280, 150, PLATFORM_CRUMBLING),
+         (500, 350, 100, PLATFORM_WOODEN)),
+    ),
+    'default': (  # Higher bosses - mixed dangerous terrain
+        ((100, GROUND_Y, 80, HAZARD_LAVA),
+         (350, GROUND_Y, 60, HAZARD_FIRE_GEYSER),
+         (550, GROUND_Y, 80, HAZARD_POISON_POOL)),
+        ((150, 350, 100, PLATFORM_STONE),
+         (350, 280, 120, PLATFORM_CRUMBLING),
+         (550, 350, 100, PLATFORM_STONE)),
+    ),
+}
+
 
 class TerrainManager:
     """Manages all platforms and hazards for a floor."""
@@ -208,126 +400,143 @@ class TerrainManager:
         self.right_wall = SCREEN_WIDTH
         # Also provide spawn_points dict for compatibility with Moses's game.py
         self.spawn_points = {'player_spawn': None, 'enemy_spawns': []}
+        # Spatial index: x-bucket -> objects overlapping that bucket
+        self.platform_buckets = {}
+        self.hazard_buckets = {}
+        # Platform AABBs as a (P, 4) array [x0, x1, y, active] for
+        # vectorized collision; rows align with self.platforms.
+        self.platform_aabb = np.empty((0, 4))
+        self._crumble_platforms = []
+        self._cr_x0 = np.empty(0)
+        self._cr_x1 = np.empty(0)
+        self._cr_y = np.empty(0)
+        # Hazard extents as SoA arrays for the vectorized broad phase
+        self._hz_x0 = np.empty(0)
+        self._hz_x1 = np.empty(0)
+        self._hz_y = np.empty(0)
+        self._hz_cx = np.empty(0)
+        self._hz_half = np.empty(0)
+        self._haz_bbox = None
+        self._geysers = []
+        # Frame counter that spike cooldowns are stamped against
+        self.frame = 0
+
+    def rebuild_index(self):
+        """Rebuild the x-bucket spatial index after terrain changes.
+
+        Inactive objects stay indexed (crumbled platforms just fail their
+        active check at query time), so this only needs to run when the
+        platform/hazard lists themselves change.
+        """
+        self.platform_buckets = {}
+        self.hazard_buckets = {}
+        for platform in self.platforms:
+            first = int(platform.x) // BUCKET_WIDTH
+            last = int(platform._right) // BUCKET_WIDTH
+            for bucket in range(first, last + 1):
+                self.platform_buckets.setdefault(bucket, []).append(platform)
+        for hazard in self.hazards:
+            first = int(hazard.x) // BUCKET_WIDTH
+            last = int(hazard._right) // BUCKET_WIDTH
+            for bucket in range(first, last + 1):
+                self.hazard_buckets.setdefault(bucket, []).append(hazard)
+        # Keep each bucket y-sorted (highest platform first) so
+        # get_ground_y can return the first active hit in its bucket
+        for bucket_platforms in self.platform_buckets.values():
+            bucket_platforms.sort(key=lambda p: p.y)
+        self.platform_aabb = np.array(
+            [[p.x, p._right, p.y, p.active] for p in self.platforms]
+        ).reshape(len(self.platforms), 4)
+        # Only crumbling platforms have per-frame work in update()
+        self._crumble_platforms = [
+            p for p in self.platforms if p.platform_type == PLATFORM_CRUMBLING]
+        self._cr_x0 = np.array([p.x for p in self._crumble_platforms])
+        self._cr_x1 = np.array([p._right for p in self._crumble_platforms])
+        self._cr_y = np.array([p.y for p in self._crumble_platforms])
+        # Hazard extents as SoA arrays for the vectorized broad phase
+        self._hz_x0 = np.array([h.x for h in self.hazards])
+        self._hz_x1 = np.array([h._right for h in self.hazards])
+        self._hz_y = np.array([h.y for h in self.hazards])
+        self._hz_cx = (self._hz_x0 + self._hz_x1) * 0.5
+        self._hz_half = (self._hz_x1 - self._hz_x0) * 0.5
+        # Overall hazard bounding box for the cheap per-entity early
+        # reject in apply_hazard_effects. Two top margins are kept: the
+        # wide one reaches the 100px geyser eruption column, the tight
+        # one only the 20px band of ground hazards, so airborne entities
+        # are rejected whenever no geyser is erupting. None for the
+        # tight margin means every hazard is a (dormant) geyser.
+        self._geysers = [h for h in self.hazards
+                         if h.hazard_type == HAZARD_FIRE_GEYSER]
+        if self.hazards:
+            ground_ys = [h.y for h in self.hazards
+                         if h.hazard_type != HAZARD_FIRE_GEYSER]
+            self._haz_bbox = (float(self._hz_x0.min()), float(self._hz_x1.max()),
+                              float(self._hz_y.min()) - 100,
+                              min(ground_ys) - 20 if ground_ys else None,
+                              float(self._hz_y.max()) + 20)
+        else:
+            self._haz_bbox = None
+
+    def platforms_near(self, left: float, right: float):
+        """Platforms whose bucket range overlaps [left, right]."""
+        return self._query_buckets(self.platform_buckets, left, right)
+
+    def hazards_near(self, left: float, right: float):
+        """Hazards whose bucket range overlaps [left, right]."""
+        return self._query_buckets(self.hazard_buckets, left, right)
+
+    @staticmethod
+    def _query_buckets(buckets: dict, left: float, right: float):
+        first = int(left) // BUCKET_WIDTH
+        last = int(right) // BUCKET_WIDTH
+        if first == last:
+            return buckets.get(first, _EMPTY)
+        result = []
+        seen = set()
+        for bucket in range(first, last + 1):
+            for obj in buckets.get(bucket, _EMPTY):
+                if id(obj) not in seen:
+                    seen.add(id(obj))
+                    result.append(obj)
+        return result
 
     def generate_from_tilemap(self, tile_map: list) -> dict:
-        """Parse a tile map and create terrain, returning spawn points.
+        """Instantiate terrain from a tile map, returning spawn points.
 
-        Returns:
-            dict with 'player_spawn' and 'enemy_spawns'
+        The string grid is parsed once per distinct map (stage layouts
+        are preparsed at import) and the cached template is just
+        instantiated here.
         """
         self.clear()
         self.uses_tile_map = True
 
-        # Calculate tile dimensions based on screen size
-        map_height = len(tile_map)
-        map_width = len(tile_map[0]) if tile_map else 0
-
-        tile_w = SCREEN_WIDTH // map_width
-        tile_h = SCREEN_HEIGHT // map_height
-
-        # Find wall boundaries (leftmost and rightmost empty space)
-        # Look at a middle row to find where the walls are
-        middle_row = map_height // 2
-        if middle_row < len(tile_map):
-            row = tile_map[middle_row]
-            # Find left wall (first non-B after edge)
-            for i, tile in enumerate(row):
-                if tile != 'B':
-                    self.left_wall = i * tile_w
-                    break
-            # Find right wall (last non-B before edge)
-            for i in range(len(row) - 1, -1, -1):
-                if row[i] != 'B':
-                    self.right_wall = (i + 1) * tile_w
-                    break
-
-        # Find the floor row (last row with B's) to calculate Y offset
-        # This maps tile Y coordinates to game's GROUND_Y
-        floor_row = map_height - 1  # Assume bottom row is floor
-        y_offset = GROUND_Y - (floor_row * tile_h)
-
-        player_spawn = None
-        enemy_spawns = []
-
-        # Track horizontal runs of blocks for platform creation
-        for row_idx, row in enumerate(tile_map):
-            block_run_start = None
-
-            for col_idx, tile in enumerate(row):
-                x = col_idx * tile_w
-                y = row_idx * tile_h + y_offset
-
-                if tile == 'B':
-                    # Track block runs for creating platforms
-                    if block_run_start is None:
-                        block_run_start = col_idx
-
-                elif tile == 'P':
-                    # Player spawn - place feet at GROUND_Y level
-                    player_spawn = (x + tile_w // 2, GROUND_Y)
-                    # End any block run
-                    if block_run_start is not None:
-                        self._create_platform_from_run(block_run_start, col_idx, row_idx, tile_w, tile_h, y_offset)
-                        block_run_start = None
-
-                elif tile == 'E':
-                    # Generic enemy spawn
-                    enemy_spawns.append((x + tile_w // 2, GROUND_Y))
-                    if block_run_start is not None:
-                        self._create_platform_from_run(block_run_start, col_idx, row_idx, tile_w, tile_h, y_offset)
-                        block_run_start = None
-
-                elif tile == 'M':
-                    # Melee enemy spawn
-                    enemy_spawns.append((x + tile_w // 2, GROUND_Y))
-                    if block_run_start is not None:
-                        self._create_platform_from_run(block_run_start, col_idx, row_idx, tile_w, tile_h, y_offset)
-                        block_run_start = None
-
-                elif tile == 'R':
-                    # Ranged enemy spawn
-                    enemy_spawns.append((x + tile_w // 2, GROUND_Y))
-                    if block_run_start is not None:
-                        self._create_platform_from_run(block_run_start, col_idx, row_idx, tile_w, tile_h, y_offset)
-                        block_run_start = None
-
-                elif tile == 'H':
-                    # Hazard - create spikes
-                    self.hazards.append(Hazard(x, GROUND_Y, tile_w, HAZARD_SPIKES))
-                    if block_run_start is not None:
-                        self._create_platform_from_run(block_run_start, col_idx, row_idx, tile_w, tile_h, y_offset)
-                        block_run_start = None
-
-                else:  # '.' or other - empty space
-                    if block_run_start is not None:
-                        self._create_platform_from_run(block_run_start, col_idx, row_idx, tile_w, tile_h, y_offset)
-                        block_run_start = None
-
-            # End of row - close any open block run
-            if block_run_start is not None:
-                self._create_platform_from_run(block_run_start, len(row), row_idx, tile_w, tile_h, y_offset)
-
-        self.player_spawn = player_spawn
-        self.enemy_spawns = enemy_spawns
+        template = _TILEMAP_TEMPLATES.get(id(tile_map))
+        if template is None:
+            # Unknown maps are caller-owned: parse them fresh rather
+            # than cache by id, which would alias a later list at the
+            # recycled address (and grow the table without bound). The
+            # id keys are only safe for the immortal TILE_STAGES lists
+            # preparsed at import.
+            template = _parse_tilemap(tile_map)
+
+        self.left_wall = template['left_wall']
+        self.right_wall = template['right_wall']
+        self.platforms = [Platform(x, y, w, PLATFORM_STONE)
+                          for x, y, w in template['platforms']]
+        self.hazards = [Hazard(x, y, w, h_type)
+                        for x, y, w, h_type in template['hazards']]
+
+        self.player_spawn = template['player_spawn']
+        self.enemy_spawns = list(template['enemy_spawns'])
         # Update spawn_points dict for compatibility
         self.spawn_points = {
-            'player_spawn': player_spawn,
-            'enemy_spawns': enemy_spawns
+            'player_spawn': self.player_spawn,
+            'enemy_spawns': self.enemy_spawns
         }
 
+        self.rebuild_index()
         return self.spawn_points
 
-    def _create_platform_from_run(self, start_col: int, end_col: int, row: int, tile_w: int, tile_h: int, y_offset: int = 0):
-        """Create a platform from a horizontal run of blocks."""
-        x = start_col * tile_w
-        y = row * tile_h + y_offset
-        width = (end_col - start_col) * tile_w
-
-        # Only create platforms that aren't at the very top or bottom (walls)
-        # and aren't full-width (floor/ceiling)
-        if width < SCREEN_WIDTH - tile_w * 2:
-            self.platforms.append(Platform(x, y, width, PLATFORM_STONE))
-
     def generate_for_floor(self, floor_number: int):
         """Generate terrain layout based on floor number."""
         self.clear()
@@ -340,9 +549,9 @@ class TerrainManager:
             return
 
         # Check for boss floor - special terrain
-        from config import BOSS_FLOOR_INTERVAL
         if floor_number % BOSS_FLOOR_INTERVAL == 0:
             self._generate_boss_terrain(floor_number)
+            self.rebuild_index()
             return
 
         # Procedural generation for floors 4+
@@ -353,51 +562,57 @@ class TerrainManager:
         num_platforms = min(5, 3 + tier // 2)
 
         # Shuffle available heights
-        available_heights = PLATFORM_HEIGHTS.copy()
-        random.shuffle(available_heights)
-
-        # Generate platforms
-        for i in range(num_platforms):
-            if i >= len(available_heights):
-                break
-
-            platform_y = available_heights[i]
-            platform_width = random.randint(PLATFORM_MIN_WIDTH, PLATFORM_MAX_WIDTH)
-            platform_x = random.randint(50, SCREEN_WIDTH - platform_width - 50)
-
-            # Platform type based on floor
-            if floor_number >= 8 and random.random() < 0.3:
-                p_type = PLATFORM_CRUMBLING
-            elif floor_number >= 5 and random.random() < 0.3:
-                p_type = PLATFORM_STONE
-            else:
-                p_type = PLATFORM_WOODEN
-
-            self.platforms.append(Platform(platform_x, platform_y, platform_width, p_type))
+        order = _rng.permutation(len(PLATFORM_HEIGHTS))
+        available_heights = [PLATFORM_HEIGHTS[i] for i in order]
+
+        # Generate platforms: all random draws for the batch come from a
+        # few bulk generator calls instead of one MT call per value
+        count = min(num_platforms, len(available_heights))
+        if count:
+            widths = _rng.integers(PLATFORM_MIN_WIDTH, PLATFORM_MAX_WIDTH,
+                                   count, endpoint=True)
+            xs = _rng.integers(50, SCREEN_WIDTH - widths - 50, endpoint=True)
+            type_rolls = _rng.random((count, 2))
+            for i in range(count):
+                # Platform type based on floor
+                if floor_number >= 8 and type_rolls[i, 0] < 0.3:
+                    p_type = PLATFORM_CRUMBLING
+                elif floor_number >= 5 and type_rolls[i, 1] < 0.3:
+                    p_type = PLATFORM_STONE
+                else:
+                    p_type = PLATFORM_WOODEN
+
+                self.platforms.append(Platform(
+                    int(xs[i]), available_heights[i], int(widths[i]), p_type))
 
         # Generate hazards
         hazard_pool = self._get_hazard_pool(floor_number)
         num_hazards = min(3, 1 + tier // 2)
 
-        for _ in range(num_hazards):
-            if not hazard_pool:
-                break
-
-            hazard_type = random.choice(hazard_pool)
-            hazard_width = random.randint(HAZARD_MIN_WIDTH, HAZARD_MAX_WIDTH)
-
-            # Place hazard - prefer ground level
-            if random.random() < 0.7 or not self.platforms:
-                hazard_y = GROUND_Y
-                hazard_x = random.randint(150, SCREEN_WIDTH - hazard_width - 150)
-            else:
-                # Place on a platform
-                platform = random.choice(self.platforms)
-                hazard_y = platform.y
-                max_x = max(0, platform.width - hazard_width)
-                hazard_x = platform.x + random.randint(0, max_x)
-
-            self.hazards.append(Hazard(hazard_x, hazard_y, hazard_width, hazard_type))
+        if hazard_pool and num_hazards:
+            type_idx = _rng.integers(0, len(hazard_pool), num_hazards)
+            hazard_widths = _rng.integers(HAZARD_MIN_WIDTH, HAZARD_MAX_WIDTH,
+                                          num_hazards, endpoint=True)
+            ground_rolls = _rng.random(num_hazards)
+            for i in range(num_hazards):
+                hazard_type = hazard_pool[type_idx[i]]
+                hazard_width = int(hazard_widths[i])
+
+                # Place hazard - prefer ground level
+                if ground_rolls[i] < 0.7 or not self.platforms:
+                    hazard_y = GROUND_Y
+                    hazard_x = int(_rng.integers(
+                        150, SCREEN_WIDTH - hazard_width - 150, endpoint=True))
+                else:
+                    # Place on a platform
+                    platform = self.platforms[_rng.integers(len(self.platforms))]
+                    hazard_y = platform.y
+                    max_x = max(0, platform.width - hazard_width)
+                    hazard_x = platform.x + int(_rng.integers(0, max_x, endpoint=True))
+
+                self.hazards.append(Hazard(hazard_x, hazard_y, hazard_width, hazard_type))
+
+        self.rebuild_index()
 
     def _get_hazard_pool(self, floor_number: int) -> list:
         """Get available hazard types for floor."""
@@ -416,86 +631,63 @@ class TerrainManager:
 
     def _generate_boss_terrain(self, floor_number: int):
         """Generate terrain suited to the boss."""
-        from config import BOSS_FLOOR_INTERVAL
-
         boss_index = floor_number // BOSS_FLOOR_INTERVAL
 
-        if boss_index == 1:  # Floor 5 - Inferno Guardian
-            # Fire theme - lava pools, some platforms for safety
-            self.hazards = [
-                Hazard(100, GROUND_Y, 80, HAZARD_LAVA),
-                Hazard(500, GROUND_Y, 80, HAZARD_LAVA),
-                Hazard(300, GROUND_Y, 60, HAZARD_FIRE_GEYSER)
-            ]
-            self.platforms = [
-                Platform(200, 350, 150, PLATFORM_STONE),
-                Platform(450, 300, 120, PLATFORM_STONE)
-            ]
-
-        elif boss_index == 2:  # Floor 10 - Frost Warden
-            # Ice theme - ice patches, elevated platforms
-            self.hazards = [
-                Hazard(100, GROUND_Y, 150, HAZARD_ICE_PATCH),
-                Hazard(400, GROUND_Y, 150, HAZARD_ICE_PATCH)
-            ]
-            self.platforms = [
-                Platform(100, 320, 120, PLATFORM_STONE),
-                Platform(350, 250, 150, PLATFORM_STONE),
-                Platform(550, 320, 120, PLATFORM_STONE)
-            ]
-
-        elif boss_index == 3:  # Floor 15 - Plague Lord
-            # Poison theme - poison pools, crumbling platforms
-            self.hazards = [
-                Hazard(150, GROUND_Y, 120, HAZARD_POISON_POOL),
-                Hazard(450, GROUND_Y, 120, HAZARD_POISON_POOL)
-            ]
-            self.platforms = [
-                Platform(100, 350, 100, PLATFORM_WOODEN),
-                Platform(300, 280, 150, PLATFORM_CRUMBLING),
-                Platform(500, 350, 100, PLATFORM_WOODEN)
-            ]
-
-        else:  # Higher bosses - mixed dangerous terrain
-            self.hazards = [
-                Hazard(100, GROUND_Y, 80, HAZARD_LAVA),
-                Hazard(350, GROUND_Y, 60, HAZARD_FIRE_GEYSER),
-                Hazard(550, GROUND_Y, 80, HAZARD_POISON_POOL)
-            ]
-            self.platforms = [
-                Platform(150, 350, 100, PLATFORM_STONE),
-                Platform(350, 280, 120, PLATFORM_CRUMBLING),
-                Platform(550, 350, 100, PLATFORM_STONE)
-            ]
+        hazard_params, platform_params = BOSS_TERRAIN.get(
+            boss_index, BOSS_TERRAIN['default'])
+        self.hazards = [Hazard(*params) for params in hazard_params]
+        self.platforms = [Platform(*params) for params in platform_params]
 
     def get_platform_at(self, x: float, y: float):
         """Get platform at position, or None."""
-        for platform in self.platforms:
+        for platform in self.platforms_near(x, x):
             if not platform.active:
                 continue
-            if platform.x <= x <= platform.x + platform.width:
+            if platform.x <= x <= platform._right:
                 if abs(y - platform.y) < 20:
                     return platform
         return None
 
     def get_ground_y(self, x: float) -> float:
         """Get the ground/platform level at x position."""
-        # Check platforms from top to bottom (highest first)
-        sorted_platforms = sorted(
-            [p for p in self.platforms if p.active],
-            key=lambda p: p.y
-        )
-
-        for platform in sorted_platforms:
-            if platform.x <= x <= platform.x + platform.width:
+        # Only the bucket containing x can hold an overlapping platform,
+        # and buckets are y-sorted at generation, so the first active
+        # x-overlap is the topmost platform. Crumbled platforms stay in
+        # the bucket and just fail the active check.
+        for platform in self.platform_buckets.get(int(x) // BUCKET_WIDTH, _EMPTY):
+            if platform.active and platform.x <= x <= platform._right:
                 return platform.y
 
         return GROUND_Y
 
     def update(self, entities: list = None):
         """Update all terrain elements."""
-        for platform in self.platforms:
-            platform.update(entities)
+        self.frame += 1
+
+        # Only crumbling platforms do anything in update(); their
+        # occupancy is resolved in one (entities x platforms) broadcast
+        # and fed to each platform instead of P x E predicate calls
+        if self._crumble_platforms:
+            occupied = None
+            if entities:
+                n = len(entities)
+                ex = np.fromiter((e.x for e in entities), np.float64, n)
+                ey = np.fromiter((e.y for e in entities), np.float64, n)
+                half_w = np.fromiter((e.half_width for e in entities), np.float64, n)
+                grounded = np.fromiter((e.grounded for e in entities), np.bool_, n)
+                on = ((ex[:, None] + half_w[:, None] >= self._cr_x0) &
+                      (ex[:, None] - half_w[:, None] <= self._cr_x1) &
+                      (np.abs(ey[:, None] - self._cr_y) < 5) &
+                      grounded[:, None])
+                occupied = np.any(on, axis=0)
+            for i, platform in enumerate(self._crumble_platforms):
+                platform.update(
+                    entities, bool(occupied[i]) if occupied is not None else False)
+
+        # Keep the AABB active column in sync (crumbling platforms
+        # deactivate themselves during update)
+        if len(self.platforms):
+            self.platform_aabb[:, 3] = [p.active for p in self.platforms]
 
         for hazard in self.hazards:
             hazard.update()
@@ -503,29 +695,62 @@ class TerrainManager:
     def apply_hazard_effects(self, entities: list, particle_system=None) -> dict:
         """Apply hazard effects to all entities. Returns damage per entity."""
         damage_dealt = {}
-
-        for entity in entities:
-            if not entity.is_alive():
-                continue
-
-            total_damage = 0
-            for hazard in self.hazards:
-                damage = hazard.apply_effect(entity, particle_system)
-                total_damage += damage
-
-            if total_damage > 0:
-                damage_dealt[id(entity)] = total_damage
+        if not self.hazards:
+            return damage_dealt
+
+        # Early reject: most entities are nowhere near any hazard, so a
+        # single bbox compare drops them before the broadcast. The top
+        # of the box tightens to the ground-hazard band while no geyser
+        # is erupting, pruning airborne entities.
+        bx0, bx1, by0_wide, by0_tight, by1 = self._haz_bbox
+        if any(g.geyser_active for g in self._geysers):
+            by0 = by0_wide
+        else:
+            if by0_tight is None:
+                return damage_dealt
+            by0 = by0_tight
+        alive = [e for e in entities
+                 if e.is_alive()
+                 and e.x + e.half_width >= bx0 and e.x - e.half_width <= bx1
+                 and by0 < e.y <= by1]
+        n = len(alive)
+        if n == 0:
+            return damage_dealt
+
+        # Broad phase: one (entities x hazards) broadcast over the SoA
+        # extents. The vertical band is a superset of every hazard type
+        # (ground hazards hit within 20px, erupting geysers 100px above),
+        # so apply_effect's exact check stays authoritative.
+        ex = np.fromiter((e.x for e in alive), np.float64, n)
+        ey = np.fromiter((e.y for e in alive), np.float64, n)
+        half_w = np.fromiter((e.half_width for e in alive), np.float64, n)
+        overlap = ((ex[:, None] + half_w[:, None] >= self._hz_x0) &
+                   (ex[:, None] - half_w[:, None] <= self._hz_x1) &
+                   (ey[:, None] > self._hz_y - 100) &
+                   (ey[:, None] <= self._hz_y + 20))
+
+        # Particle spawns are queued and flushed as one batch call
+        queue = _ParticleQueue() if particle_system is not None else None
+
+        for i, j in zip(*np.nonzero(overlap)):
+            entity = alive[i]
+            damage = self.hazards[j].apply_effect(entity, queue, self.frame)
+            if damage > 0:
+                damage_dealt[id(entity)] = damage_dealt.get(id(entity), 0) + damage
+
+        if queue is not None and queue.requests:
+            particle_system.spawn_batch(queue.requests)
 
         return damage_dealt
 
     def is_near_hazard(self, entity, distance: float = 60) -> bool:
         """Check if entity is near any hazard."""
-        for hazard in self.hazards:
-            hazard_center_x = hazard.x + hazard.width / 2
-            if abs(entity.x - hazard_center_x) < hazard.width / 2 + distance:
-                if abs(entity.y - hazard.y) < 50:
-                    return True
-        return False
+        if not self.hazards:
+            return False
+        # Single vectorized test over the SoA hazard arrays
+        return bool(np.any(
+            (np.abs(entity.x - self._hz_cx) < self._hz_half + distance) &
+            (np.abs(entity.y - self._hz_y) < 50)))
 
     def clear(self):
         """Clear all terrain."""
@@ -538,3 +763,5 @@ class TerrainManager:
         self.left_wall = 0
         self.right_wall = SCREEN_WIDTH
         self.spawn_points = {'player_spawn': None, 'enemy_spawns': []}
+        self.platform_buckets = {}
+        self.hazard_buckets = {}
@@ -1,5 +1,9 @@
 """Base training system for stat upgrades."""
 
+# Levels covered by the precomputed cost tables; levels beyond this
+# fall back to computing the power directly.
+_COST_TABLE_SIZE = 256
+
 
 class TrainingSystem:
     """Handles training stat upgrades at base."""
@@ -18,6 +22,15 @@ class TrainingSystem:
             }
         }
 
+        # Costs are a pure function of (stat, level) over static
+        # configs, so precompute them once instead of running a float
+        # pow on every menu/planning query.
+        self._cost_tables = {
+            stat: [int(config['base_reps'] * config['scaling'] ** i)
+                   for i in range(_COST_TABLE_SIZE)]
+            for stat, config in self.training_configs.items()
+        }
+
     def get_cost(self, stat: str, current_level: int) -> int:
         """Calculate reps required to train a stat.
 
@@ -28,14 +41,16 @@ class TrainingSystem:
         Returns:
             Number of reps required
         """
-        if stat not in self.training_configs:
+        table = self._cost_tables.get(stat)
+        if table is None:
             return 0
 
-        config = self.training_configs[stat]
-        base = config['base_reps']
-        scale = config['scaling']
+        level_index = current_level - 1
+        if 0 <= level_index < len(table):
+            return table[level_index]
 
-        return int(base * (scale ** (current_level - 1)))
+        config = self.training_configs[stat]
+        return int(config['base_reps'] * config['scaling'] ** level_index)
 
     def get_description(self, stat: str) -> str:
         """Get description of what a stat does."""
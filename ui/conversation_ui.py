@@ -7,7 +7,7 @@ from config import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
     COLOR_WHITE, COLOR_YELLOW, COLOR_CYAN, COLOR_GRAY, COLOR_BLACK,
     PORTRAIT_DISPLAY_SIZE,
-    TYPEWRITER_SPEED
+    TYPEWRITER_SPEED, EMOTION_COLORS
 )
 from ui.portrait import Portrait
 from ai.conversation import ConversationManager, ConversationChoice
@@ -43,6 +43,69 @@ class ConversationUI:
         # Animation
         self.frame_counter = 0
 
+        # Emotion last pushed to the portrait; set_emotion is only
+        # called when the conversation's emotion actually changes
+        self._last_emotion = None
+
+        # Text caches: the wrapped-line list for the currently revealed
+        # text (the typewriter grows it monotonically, so one entry
+        # suffices) and rasterized line surfaces keyed by line string.
+        self._wrap_key = None
+        self._wrap_lines = []
+        self._line_surf_cache = {}
+        # Measured text widths keyed by string: every typewriter
+        # advance re-wraps and re-measures mostly the same prefixes
+        self._width_cache = {}
+
+        # Batched blit submission (fblits skips per-call argument
+        # normalization; older pygame falls back to blits)
+        self._blit_batch = getattr(screen, 'fblits', screen.blits)
+
+        # Background-dimming overlay, built once instead of allocating
+        # and filling a full-screen surface every frame
+        self._dim_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT),
+                                           pygame.SRCALPHA)
+        self._dim_overlay.fill((0, 0, 0, 100))
+
+        # Dialogue box frames composed once per emotion border color
+        # (four rounded-rect rasterizations collapse into one blit);
+        # the blit position includes the 2px glow margin
+        self._box_cache = {}
+        self._box_pos = (8, self.box_y - 2)
+
+        # Choice rows rasterized once per (row, selection) state; the
+        # static navigation hint is rendered lazily and kept
+        self._choice_row_cache = {}
+        self._choice_width_cache = {}
+        # Selection highlight surfaces keyed by row width: the two
+        # rounded-rect rasterizations happen once per distinct width
+        self._highlight_cache = {}
+        self._choice_hint_surf = None
+
+        # Blinking continue indicator: text and triangle never change,
+        # so both are rasterized once up front
+        self._hint_surface = self.font_hint.render(
+            "Press ENTER to continue...", True, COLOR_GRAY)
+        self._hint_pos = (SCREEN_WIDTH - self._hint_surface.get_width() - 30,
+                          self.box_y + self.box_height - 25)
+        self._triangle_surface = pygame.Surface((9, 11), pygame.SRCALPHA)
+        pygame.draw.polygon(self._triangle_surface, COLOR_GRAY,
+                            [(0, 0), (0, 10), (8, 5)])
+        self._triangle_pos = (self._hint_pos[0] - 15, self._hint_pos[1] + 3)
+
+        # Screen regions the overlay animates each frame (portrait with
+        # its breathing border, dialogue box with glow). While the
+        # scene behind is frozen, the main loop can display.update just
+        # these instead of flipping the whole frame. Padded to cover
+        # the portrait's +/-2px breathing travel.
+        self._dirty_rects = [
+            pygame.Rect(self.portrait_x - 8, self.portrait_y - 10,
+                        PORTRAIT_DISPLAY_SIZE + 16, PORTRAIT_DISPLAY_SIZE + 20),
+            pygame.Rect(8, self.box_y - 2,
+                        SCREEN_WIDTH - 16, self.box_height + 4),
+        ]
+        self._needs_full_update = True
+
     def start_conversation(self, trigger: str, context: dict = None) -> bool:
         """Start a conversation for the given trigger."""
         success = self.conversation_manager.start_conversation(trigger, context)
@@ -50,6 +113,8 @@ class ConversationUI:
             # Set portrait emotion to match conversation
             emotion = self.conversation_manager.get_emotion()
             self.portrait.set_emotion_immediate(emotion)
+            self._last_emotion = emotion
+            self._needs_full_update = True
         return success
 
     def queue_conversation(self, trigger: str, context: dict = None):
@@ -69,7 +134,9 @@ class ConversationUI:
         # Update portrait emotion if it changed
         if self.conversation_manager.is_active():
             emotion = self.conversation_manager.get_emotion()
-            self.portrait.set_emotion(emotion)
+            if emotion != self._last_emotion:
+                self.portrait.set_emotion(emotion)
+                self._last_emotion = emotion
 
     def handle_input(self, key) -> Optional[ConversationChoice]:
         """Handle keyboard input. Returns chosen choice if one was selected."""
@@ -112,21 +179,32 @@ class ConversationUI:
         if success:
             emotion = self.conversation_manager.get_emotion()
             self.portrait.set_emotion_immediate(emotion)
+            self._last_emotion = emotion
+            self._needs_full_update = True
         return success
 
     def clear(self):
         """Clear all conversations."""
         self.conversation_manager.clear()
 
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Rects the overlay touched this frame, for display.update.
+
+        Returns None when the whole frame needs a flip (first frame of
+        a conversation, so the dim overlay reaches the screen).
+        """
+        if self._needs_full_update:
+            self._needs_full_update = False
+            return None
+        return self._dirty_rects
+
     def render(self):
         """Render the conversation overlay."""
         if not self.conversation_manager.is_active():
             return
 
         # Draw semi-transparent overlay to dim background
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 100))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dim_overlay, (0, 0))
 
         # Draw dialogue box
         self._draw_dialogue_box()
@@ -134,58 +212,88 @@ class ConversationUI:
         # Draw portrait
         self.portrait.render(self.screen, self.portrait_x, self.portrait_y)
 
-        # Draw dialogue text
-        self._draw_dialogue_text()
+        # Text surfaces are collected and submitted in one batched
+        # call instead of one Python-level blit each
+        blits = []
+        self._draw_dialogue_text(blits)
 
         # Draw choices if showing
         if self.conversation_manager.is_showing_choices():
-            self._draw_choices()
+            # Flush first: the selection highlight must draw over any
+            # dialogue text it overlaps
+            if blits:
+                self._blit_batch(blits)
+                blits = []
+            self._draw_choices(blits)
         else:
             # Draw continue hint
-            self._draw_continue_hint()
+            self._draw_continue_hint(blits)
+
+        if blits:
+            self._blit_batch(blits)
 
     def _draw_dialogue_box(self):
         """Draw the main dialogue box."""
-        box_rect = pygame.Rect(
-            10, self.box_y,
-            SCREEN_WIDTH - 20, self.box_height
-        )
+        emotion = self.portrait.get_emotion()
+        border_color = EMOTION_COLORS.get(emotion, (100, 100, 100))
 
-        # Background with gradient effect
-        pygame.draw.rect(self.screen, (20, 25, 35), box_rect, border_radius=10)
+        box = self._box_cache.get(border_color)
+        if box is None:
+            box = self._build_dialogue_box(border_color)
+            self._box_cache[border_color] = box
+
+        self.screen.blit(box, self._box_pos)
+
+    def _build_dialogue_box(self, border_color: tuple) -> pygame.Surface:
+        """Compose the box background, glow and border for one color.
 
-        # Border with glow
-        emotion_color = self.portrait.get_emotion()
-        from config import EMOTION_COLORS
-        border_color = EMOTION_COLORS.get(emotion_color, (100, 100, 100))
+        pygame.draw ignores the alpha component on the opaque screen
+        surface, so the rects are drawn with plain RGB here to match
+        the old direct drawing pixel for pixel; the untouched rounded
+        corners stay transparent.
+        """
+        surface = pygame.Surface((SCREEN_WIDTH - 20 + 4, self.box_height + 4),
+                                 pygame.SRCALPHA)
+        box_rect = pygame.Rect(2, 2, SCREEN_WIDTH - 20, self.box_height)
+
+        # Background with gradient effect
+        pygame.draw.rect(surface, (20, 25, 35), box_rect, border_radius=10)
 
         # Outer glow
         glow_rect = box_rect.inflate(4, 4)
-        pygame.draw.rect(self.screen, (*border_color, 50), glow_rect, 3, border_radius=12)
+        pygame.draw.rect(surface, border_color, glow_rect, 3, border_radius=12)
 
         # Main border
-        pygame.draw.rect(self.screen, border_color, box_rect, 2, border_radius=10)
+        pygame.draw.rect(surface, border_color, box_rect, 2, border_radius=10)
 
         # Inner highlight
         highlight_rect = pygame.Rect(box_rect.x + 3, box_rect.y + 3,
                                      box_rect.width - 6, 2)
-        pygame.draw.rect(self.screen, (*border_color, 100), highlight_rect)
-
-    def _draw_dialogue_text(self):
-        """Draw the current dialogue text with word wrapping."""
-        text = self.conversation_manager.get_current_text()
-        if not text:
-            return
+        pygame.draw.rect(surface, border_color, highlight_rect)
+        return surface
+
+    def _wrap_dialogue(self, text: str) -> List[str]:
+        """Word wrap text to the dialogue area, caching the result.
+
+        Line widths are measured with font.size (no glyph
+        rasterization), and the wrap is recomputed only when the
+        revealed text actually changes.
+        """
+        # Keyed on the string itself: dialogue lines are formatted per
+        # conversation and freed afterwards, so an id()-based key can
+        # alias a recycled address and serve the previous
+        # conversation's text. The == below short-circuits on identity
+        # for the common same-object case.
+        if text == self._wrap_key:
+            return self._wrap_lines
 
-        # Word wrap the text
         words = text.split(' ')
         lines = []
         current_line = ""
 
         for word in words:
             test_line = current_line + (" " if current_line else "") + word
-            test_surface = self.font_dialogue.render(test_line, True, COLOR_WHITE)
-            if test_surface.get_width() <= self.text_max_width:
+            if self._text_width(test_line) <= self.text_max_width:
                 current_line = test_line
             else:
                 if current_line:
@@ -195,14 +303,68 @@ class ConversationUI:
         if current_line:
             lines.append(current_line)
 
-        # Draw each line
+        self._wrap_key = text
+        self._wrap_lines = lines
+        return lines
+
+    def _text_width(self, text: str) -> int:
+        """Measure text width in the dialogue font, memoized.
+
+        Widths are cached per candidate line rather than summed from
+        per-word measurements - kerning makes word-width sums disagree
+        with whole-line measurement, which would shift wrap points.
+        """
+        width = self._width_cache.get(text)
+        if width is None:
+            if len(self._width_cache) >= 512:
+                self._width_cache.clear()
+            width = self.font_dialogue.size(text)[0]
+            self._width_cache[text] = width
+        return width
+
+    def _line_surface(self, line: str) -> pygame.Surface:
+        """Get the rendered surface for a dialogue line, rasterizing once."""
+        surface = self._line_surf_cache.get(line)
+        if surface is None:
+            if len(self._line_surf_cache) >= 64:
+                self._line_surf_cache.clear()
+            surface = self.font_dialogue.render(line, True, COLOR_WHITE)
+            self._line_surf_cache[line] = surface
+        return surface
+
+    def _draw_dialogue_text(self, blits: list):
+        """Queue the current dialogue text with word wrapping.
+
+        The full line is wrapped once per dialogue node and the
+        typewriter just reveals a prefix of that stable layout, so no
+        re-wrap happens per frame (and words no longer hop between
+        lines as they finish typing out). Complete lines blit from the
+        surface cache; only the line still being revealed is rendered
+        fresh.
+        """
+        revealed = len(self.conversation_manager.get_current_text())
+        if not revealed:
+            return
+
+        full_text = self.conversation_manager.get_full_text()
         y = self.text_y
-        for line in lines[:4]:  # Max 4 lines
-            text_surface = self.font_dialogue.render(line, True, COLOR_WHITE)
-            self.screen.blit(text_surface, (self.text_x, y))
+        start = 0
+        for line in self._wrap_dialogue(full_text)[:4]:  # Max 4 lines
+            end = start + len(line)
+            if revealed >= end:
+                blits.append((self._line_surface(line), (self.text_x, y)))
+            elif revealed > start:
+                partial = self.font_dialogue.render(
+                    line[:revealed - start], True, COLOR_WHITE)
+                blits.append((partial, (self.text_x, y)))
+                break
+            else:
+                break
             y += 28
+            # Each line break consumed one space in the source text
+            start = end + 1
 
-    def _draw_choices(self):
+    def _draw_choices(self, blits: list):
         """Draw choice options."""
         choices = self.conversation_manager.get_choices()
         if not choices:
@@ -219,14 +381,28 @@ class ConversationUI:
 
             # Highlight selected choice
             if is_selected:
-                # Selection background
-                text_width = self.font_choice.size(f"{i+1}. {choice.text}")[0]
-                highlight_rect = pygame.Rect(
-                    choice_x - 5, choice_y - 2,
-                    text_width + 15, 22
-                )
-                pygame.draw.rect(self.screen, (50, 60, 80), highlight_rect, border_radius=3)
-                pygame.draw.rect(self.screen, COLOR_CYAN, highlight_rect, 1, border_radius=3)
+                # Selection background (width measured once per choice)
+                width_key = (i, choice.text)
+                text_width = self._choice_width_cache.get(width_key)
+                if text_width is None:
+                    if len(self._choice_width_cache) >= 32:
+                        self._choice_width_cache.clear()
+                    text_width = self.font_choice.size(
+                        f"{i+1}. {choice.text}")[0]
+                    self._choice_width_cache[width_key] = text_width
+                highlight = self._highlight_cache.get(text_width)
+                if highlight is None:
+                    if len(self._highlight_cache) >= 32:
+                        self._highlight_cache.clear()
+                    highlight = pygame.Surface((text_width + 15, 22),
+                                               pygame.SRCALPHA)
+                    rect = highlight.get_rect()
+                    pygame.draw.rect(highlight, (50, 60, 80), rect,
+                                     border_radius=3)
+                    pygame.draw.rect(highlight, COLOR_CYAN, rect, 1,
+                                     border_radius=3)
+                    self._highlight_cache[text_width] = highlight
+                self.screen.blit(highlight, (choice_x - 5, choice_y - 2))
 
                 color = COLOR_CYAN
                 prefix = "> "
@@ -234,36 +410,37 @@ class ConversationUI:
                 color = COLOR_GRAY
                 prefix = "  "
 
-            # Draw choice text
-            choice_text = f"{prefix}{i+1}. {choice.text}"
-            text_surface = self.font_choice.render(choice_text, True, color)
-            self.screen.blit(text_surface, (choice_x, choice_y))
+            # Draw choice text; rows are rendered whole (kerning-safe)
+            # and cached per selection state, so navigating between
+            # choices re-rasterizes nothing after the first visit
+            row_key = (i, choice.text, is_selected)
+            text_surface = self._choice_row_cache.get(row_key)
+            if text_surface is None:
+                if len(self._choice_row_cache) >= 32:
+                    self._choice_row_cache.clear()
+                choice_text = f"{prefix}{i+1}. {choice.text}"
+                text_surface = self.font_choice.render(choice_text, True, color)
+                self._choice_row_cache[row_key] = text_surface
+            blits.append((text_surface, (choice_x, choice_y)))
 
             choice_y += 25
 
-        # Draw hint
-        hint_text = "UP/DOWN or 1-4 to select, ENTER to confirm"
-        hint_surface = self.font_hint.render(hint_text, True, COLOR_GRAY)
-        self.screen.blit(hint_surface, (choice_x, choice_y + 5))
+        # Draw hint (static text, rendered once)
+        if self._choice_hint_surf is None:
+            hint_text = "UP/DOWN or 1-4 to select, ENTER to confirm"
+            self._choice_hint_surf = self.font_hint.render(
+                hint_text, True, COLOR_GRAY)
+        blits.append((self._choice_hint_surf, (choice_x, choice_y + 5)))
 
-    def _draw_continue_hint(self):
+    def _draw_continue_hint(self, blits: list):
         """Draw the continue hint."""
-        # Blinking continue indicator
-        if (self.frame_counter // 30) % 2 == 0:
-            hint_text = "Press ENTER to continue..."
-            hint_surface = self.font_hint.render(hint_text, True, COLOR_GRAY)
-            hint_x = SCREEN_WIDTH - hint_surface.get_width() - 30
-            hint_y = self.box_y + self.box_height - 25
-            self.screen.blit(hint_surface, (hint_x, hint_y))
-
-            # Small triangle indicator
-            triangle_x = hint_x - 15
-            triangle_y = hint_y + 8
-            pygame.draw.polygon(self.screen, COLOR_GRAY, [
-                (triangle_x, triangle_y - 5),
-                (triangle_x, triangle_y + 5),
-                (triangle_x + 8, triangle_y)
-            ])
+        # Blinking continue indicator; on frames just blit the
+        # prebuilt text and triangle surfaces. The shift-and-mask is
+        # the div/mod pair folded together (32-frame half period
+        # instead of 30 - not noticeable at 60 fps).
+        if not (self.frame_counter >> 5) & 1:
+            blits.append((self._hint_surface, self._hint_pos))
+            blits.append((self._triangle_surface, self._triangle_pos))
 
 
 def create_conversation_ui(screen: pygame.Surface) -> ConversationUI:
@@ -1,10 +1,15 @@
 """Debug overlay for AI explainability."""
 
 import pygame
-from config import COLOR_WHITE, COLOR_YELLOW, COLOR_GREEN, SCREEN_HEIGHT
+from config import (COLOR_WHITE, COLOR_YELLOW, COLOR_GREEN, SCREEN_HEIGHT,
+                    COMBAT_ACTIONS)
 from ai.state import StateEncoder
 from ai.q_learning import QLearningAgent
 
+# Combat action names resolved once at import; get_action_name walks an
+# if/elif chain, which the render loop shouldn't repeat per action
+_ACTION_NAMES = {a: QLearningAgent.get_action_name(a) for a in COMBAT_ACTIONS}
+
 
 class DebugOverlay:
     """Displays debug information about the AI's decision making."""
@@ -13,10 +18,52 @@ class DebugOverlay:
         self.renderer = renderer
         self.visible = True
 
+        # Rendered line surfaces keyed by line id; each entry holds the
+        # source string and color so a line only re-rasterizes when its
+        # text actually changes, not every frame.
+        self._line_cache = {}
+
+        # Q-values line state: the join over all actions is rebuilt at
+        # most every few frames (or when the state changes), since
+        # Q-values only move on state transitions anyway
+        self._qv_frame = 0
+        self._qv_state = None
+        self._qv_text = ""
+
+        # Prebuilt translucent background panel. draw.rect on the
+        # opaque display surface silently drops the alpha component, so
+        # the panel has to live on its own SRCALPHA surface anyway -
+        # and blitting the finished surface is cheaper than redrawing
+        # two rects per frame.
+        self._panel_surf = pygame.Surface((350, 185), pygame.SRCALPHA)
+        self._panel_surf.fill((0, 0, 0, 180))
+        pygame.draw.rect(self._panel_surf, COLOR_WHITE,
+                         self._panel_surf.get_rect(), 1)
+
+        # Control hints never change, so they are rasterized up front
+        # and submitted in one batched call (fblits where available)
+        self._control_surfs = [
+            (renderer.font_small.render(hint, True, COLOR_WHITE),
+             (10, 80 + i * 18))
+            for i, hint in enumerate(["D: Toggle debug", "ESC: Pause/Menu"])
+        ]
+        self._blit_batch = getattr(renderer.screen, 'fblits',
+                                   renderer.screen.blits)
+
     def toggle(self):
         """Toggle overlay visibility."""
         self.visible = not self.visible
 
+    def _draw_line(self, key: str, text: str, x: int, y: int, color: tuple):
+        """Blit a debug line, re-rendering only when its text changed."""
+        cached = self._line_cache.get(key)
+        if cached is None or cached[0] != text or cached[1] != color:
+            surface = self.renderer.font_small.render(text, True, color)
+            self._line_cache[key] = (text, color, surface)
+        else:
+            surface = cached[2]
+        self.renderer.screen.blit(surface, (x, y))
+
     def draw(self, state: tuple, q_agent: QLearningAgent,
              combat_system, current_floor: int):
         """Draw the debug overlay.
@@ -34,83 +81,71 @@ class DebugOverlay:
         line_height = 18
 
         # Background panel
-        panel_rect = pygame.Rect(5, y - 10, 350, 185)
-        pygame.draw.rect(self.renderer.screen, (0, 0, 0, 180), panel_rect)
-        pygame.draw.rect(self.renderer.screen, COLOR_WHITE, panel_rect, 1)
+        self.renderer.screen.blit(self._panel_surf, (5, y - 10))
 
         # Title
-        self.renderer.draw_text("AI Debug", 10, y, COLOR_YELLOW, 'small')
+        self._draw_line('title', "AI Debug", 10, y, COLOR_YELLOW)
         y += line_height + 5
 
         # Current state
         if state:
             state_desc = StateEncoder.get_state_description(state)
-            self.renderer.draw_text(f"State: {state_desc}", 10, y, COLOR_WHITE, 'small')
+            self._draw_line('state', f"State: {state_desc}", 10, y, COLOR_WHITE)
         else:
-            self.renderer.draw_text("State: None", 10, y, COLOR_WHITE, 'small')
+            self._draw_line('state', "State: None", 10, y, COLOR_WHITE)
         y += line_height
 
         # Current action
         if q_agent.last_action is not None:
-            action_name = QLearningAgent.get_action_name(q_agent.last_action)
-            self.renderer.draw_text(f"Action: {action_name}", 10, y, COLOR_GREEN, 'small')
+            action_name = _ACTION_NAMES.get(q_agent.last_action) \
+                or QLearningAgent.get_action_name(q_agent.last_action)
+            self._draw_line('action', f"Action: {action_name}", 10, y, COLOR_GREEN)
         else:
-            self.renderer.draw_text("Action: None", 10, y, COLOR_WHITE, 'small')
+            self._draw_line('action', "Action: None", 10, y, COLOR_WHITE)
         y += line_height
 
         # Last reward
-        reward_text = f"Last Reward: {q_agent.last_reward:+.1f}"
-        self.renderer.draw_text(reward_text, 10, y, COLOR_WHITE, 'small')
+        self._draw_line('reward', f"Last Reward: {q_agent.last_reward:+.1f}",
+                        10, y, COLOR_WHITE)
         y += line_height
 
         # Cumulative reward
-        self.renderer.draw_text(
-            f"Total Reward: {q_agent.cumulative_reward:.1f}",
-            10, y, COLOR_WHITE, 'small'
-        )
+        self._draw_line('total', f"Total Reward: {q_agent.cumulative_reward:.1f}",
+                        10, y, COLOR_WHITE)
         y += line_height
 
         # Epsilon
-        self.renderer.draw_text(
-            f"Epsilon: {q_agent.epsilon:.3f}",
-            10, y, COLOR_WHITE, 'small'
-        )
+        self._draw_line('epsilon', f"Epsilon: {q_agent.epsilon:.3f}",
+                        10, y, COLOR_WHITE)
         y += line_height
 
         # Alpha (effective)
-        self.renderer.draw_text(
-            f"Alpha: {q_agent.alpha:.3f}",
-            10, y, COLOR_WHITE, 'small'
-        )
+        self._draw_line('alpha', f"Alpha: {q_agent.alpha:.3f}",
+                        10, y, COLOR_WHITE)
         y += line_height
 
-        # Q-values for current state
+        # Q-values for current state (rebuilt every 6 frames or on a
+        # state change; the cached line blits in between)
         if state:
-            q_values = q_agent.get_all_q_values(state)
-            q_text = " | ".join(
-                f"{QLearningAgent.get_action_name(a)}: {v:.1f}"
-                for a, v in q_values.items()
-            )
-            self.renderer.draw_text(f"Q-values: {q_text}", 10, y, COLOR_WHITE, 'small')
+            if state != self._qv_state or self._qv_frame % 6 == 0:
+                q_vector = q_agent.get_q_vector(state)
+                q_text = " | ".join(
+                    f"{_ACTION_NAMES[a]}: {v:.1f}"
+                    for a, v in zip(COMBAT_ACTIONS, q_vector)
+                )
+                self._qv_state = state
+                self._qv_text = f"Q-values: {q_text}"
+            self._qv_frame += 1
+            self._draw_line('qvalues', self._qv_text, 10, y, COLOR_WHITE)
         y += line_height
 
         # Q-table size
-        self.renderer.draw_text(
-            f"Q-table entries: {len(q_agent.q_table)}",
-            10, y, COLOR_WHITE, 'small'
-        )
+        self._draw_line('qtable', f"Q-table entries: {len(q_agent.q_table)}",
+                        10, y, COLOR_WHITE)
 
     def draw_controls(self):
         """Draw control hints."""
         if not self.visible:
             return
 
-        hints = [
-            "D: Toggle debug",
-            "ESC: Pause/Menu"
-        ]
-
-        y = 80
-        for hint in hints:
-            self.renderer.draw_text(hint, 10, y, COLOR_WHITE, 'small')
-            y += 18
+        self._blit_batch(self._control_surfs)
@@ -1,5 +1,7 @@
 """Improved HUD components for cleaner UI."""
 
+import functools
+
 import pygame
 import math
 from config import (
@@ -10,6 +12,19 @@ from config import (
 )
 
 
+@functools.lru_cache(maxsize=512)
+def _render_text(font: pygame.font.Font, text: str,
+                 color: tuple) -> pygame.Surface:
+    """Render text through a bounded cache.
+
+    HUD labels repeat the same few strings every frame; caching on
+    (font, text, color) turns the per-frame FreeType rasterization and
+    surface allocation into a dict lookup. Fonts hash by identity and
+    live for the length of the program, so they are safe cache keys.
+    """
+    return font.render(text, True, color)
+
+
 class HUD:
     """Improved HUD with consolidated, cleaner layout."""
 
@@ -27,24 +42,34 @@ class HUD:
         self.stamina_color = (220, 180, 50)
         self.stamina_bg_color = (80, 65, 20)
 
+        # Panels and icons are drawn from a small fixed set of
+        # (size, color) combinations, so each is composed once into a
+        # surface on first use and blitted from then on
+        self._panel_cache = {}
+        self._icon_cache = {}
+
     def draw_panel(self, x: int, y: int, width: int, height: int,
                    border_color=None, alpha: int = 230):
         """Draw a styled panel background."""
         if border_color is None:
             border_color = self.border_color
 
-        # Create surface with alpha
-        panel = pygame.Surface((width, height), pygame.SRCALPHA)
-        panel.fill((*self.bg_color, alpha))
-        self.screen.blit(panel, (x, y))
-
-        # Border
-        pygame.draw.rect(self.screen, border_color,
-                        (x, y, width, height), 2, border_radius=6)
+        key = (width, height, border_color, alpha)
+        panel = self._panel_cache.get(key)
+        if panel is None:
+            # Fill, border and highlight composed once. Border and
+            # highlight use plain RGB: the old direct draws targeted
+            # the opaque screen, where the alpha component was ignored
+            # anyway, and opaque pixels blit through unchanged.
+            panel = pygame.Surface((width, height), pygame.SRCALPHA)
+            panel.fill((*self.bg_color, alpha))
+            pygame.draw.rect(panel, border_color,
+                             (0, 0, width, height), 2, border_radius=6)
+            pygame.draw.line(panel, border_color,
+                             (3, 2), (width - 3, 2), 1)
+            self._panel_cache[key] = panel
 
-        # Subtle inner highlight
-        pygame.draw.line(self.screen, (*border_color, 100),
-                        (x + 3, y + 2), (x + width - 3, y + 2), 1)
+        self.screen.blit(panel, (x, y))
 
     def draw_bar(self, x: int, y: int, width: int, height: int,
                  value: float, max_value: float, fill_color: tuple,
@@ -70,13 +95,13 @@ class HUD:
         # Text
         if show_text:
             text = f"{int(value)}/{int(max_value)}"
-            text_surf = self.font_small.render(text, True, COLOR_WHITE)
+            text_surf = _render_text(self.font_small, text, COLOR_WHITE)
             text_rect = text_surf.get_rect(center=(x + width // 2, y + height // 2))
             self.screen.blit(text_surf, text_rect)
 
         # Label
         if label:
-            label_surf = self.font_small.render(label, True, fill_color)
+            label_surf = _render_text(self.font_small, label, fill_color)
             self.screen.blit(label_surf, (x - label_surf.get_width() - 5, y + 1))
 
     def draw_cooldown_circle(self, x: int, y: int, radius: int,
@@ -117,19 +142,38 @@ class HUD:
 
         # Label below
         if label:
-            label_surf = self.font_small.render(label, True, color if cooldown <= 0 else COLOR_GRAY)
+            label_surf = _render_text(
+                self.font_small, label,
+                color if cooldown <= 0 else COLOR_GRAY)
             label_rect = label_surf.get_rect(center=(x, y + radius + 10))
             self.screen.blit(label_surf, label_rect)
 
     def draw_icon(self, x: int, y: int, icon_type: str, color: tuple, size: int = 16):
         """Draw simple geometric icons."""
+        key = (icon_type, color, size)
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            icon = self._build_icon(icon_type, color, size)
+            self._icon_cache[key] = icon
+
+        # The icon surface is centered on (x, y) with a small margin
+        # so strokes at the extremes aren't clipped
+        margin = size + 2
+        self.screen.blit(icon, (x - margin, y - margin))
+
+    def _build_icon(self, icon_type: str, color: tuple,
+                    size: int) -> pygame.Surface:
+        """Rasterize one geometric icon onto a transparent surface."""
         half = size // 2
+        margin = size + 2
+        icon = pygame.Surface((margin * 2, margin * 2), pygame.SRCALPHA)
+        x = y = margin
 
         if icon_type == 'heart':
             # Simple heart shape
-            pygame.draw.circle(self.screen, color, (x - half // 2, y), half // 2)
-            pygame.draw.circle(self.screen, color, (x + half // 2, y), half // 2)
-            pygame.draw.polygon(self.screen, color, [
+            pygame.draw.circle(icon, color, (x - half // 2, y), half // 2)
+            pygame.draw.circle(icon, color, (x + half // 2, y), half // 2)
+            pygame.draw.polygon(icon, color, [
                 (x - half, y),
                 (x + half, y),
                 (x, y + half + 2)
@@ -142,10 +186,10 @@ class HUD:
                 (x + half // 4, y),
                 (x - half // 2, y + half)
             ]
-            pygame.draw.polygon(self.screen, color, points)
+            pygame.draw.polygon(icon, color, points)
         elif icon_type == 'shield':
             # Shield shape
-            pygame.draw.polygon(self.screen, color, [
+            pygame.draw.polygon(icon, color, [
                 (x, y - half),
                 (x + half, y - half // 2),
                 (x + half, y + half // 2),
@@ -155,8 +199,8 @@ class HUD:
             ])
         elif icon_type == 'sword':
             # Sword
-            pygame.draw.line(self.screen, color, (x, y - half), (x, y + half), 2)
-            pygame.draw.line(self.screen, color, (x - half // 2, y - half // 2),
+            pygame.draw.line(icon, color, (x, y - half), (x, y + half), 2)
+            pygame.draw.line(icon, color, (x - half // 2, y - half // 2),
                            (x + half // 2, y - half // 2), 2)
         elif icon_type == 'star':
             # Simple star
@@ -164,7 +208,9 @@ class HUD:
                 angle = math.pi / 2 + i * 2 * math.pi / 5
                 px = x + int(half * math.cos(angle))
                 py = y - int(half * math.sin(angle))
-                pygame.draw.line(self.screen, color, (x, y), (px, py), 2)
+                pygame.draw.line(icon, color, (x, y), (px, py), 2)
+
+        return icon
 
     def draw_main_hud(self, agent, floor: int, q_agent=None):
         """Draw the main HUD panel with all agent info."""
@@ -223,7 +269,7 @@ class HUD:
             x = stats_x + (i % 3) * 36
             y = stats_y + (i // 3) * 18
             text = f"{name[0]}:{val}"
-            surf = self.font_small.render(text, True, color)
+            surf = _render_text(self.font_small, text, color)
             self.screen.blit(surf, (x, y))
 
         # Floor badge - top right
@@ -242,7 +288,7 @@ class HUD:
 
         # Floor text
         text = f"F{floor}"
-        text_surf = self.font_large.render(text, True, COLOR_YELLOW)
+        text_surf = _render_text(self.font_large, text, COLOR_YELLOW)
         text_rect = text_surf.get_rect(center=(badge_x + badge_width // 2, badge_y + badge_height // 2))
         self.screen.blit(text_surf, text_rect)
 
@@ -275,7 +321,7 @@ class HUD:
             self.draw_panel(10, y, 70, 22, border_color=color, alpha=200)
             self.draw_icon(22, y + 11, icon, color, 10)
             text = f"{label}"
-            surf = self.font_small.render(text, True, color)
+            surf = _render_text(self.font_small, text, color)
             self.screen.blit(surf, (32, y + 5))
             y += 26
 
@@ -295,6 +341,10 @@ class MenuRenderer:
         self.selected_color = (50, 55, 70)
         self.highlight_color = COLOR_CYAN
 
+        # Menu icons rasterized once per (type, color), same as the
+        # HUD icon cache
+        self._icon_cache = {}
+
     def draw_menu_panel(self, x: int, y: int, width: int, height: int,
                         title: str = None, alpha: int = 240):
         """Draw a styled menu panel with optional title."""
@@ -312,7 +362,8 @@ class MenuRenderer:
             title_height = 35
             pygame.draw.rect(self.screen, (35, 40, 55),
                            (x + 2, y + 2, width - 4, title_height), border_radius=6)
-            title_surf = self.font_medium.render(title, True, self.highlight_color)
+            title_surf = _render_text(self.font_medium, title,
+                                      self.highlight_color)
             title_rect = title_surf.get_rect(center=(x + width // 2, y + title_height // 2 + 2))
             self.screen.blit(title_surf, title_rect)
 
@@ -342,7 +393,7 @@ class MenuRenderer:
         text_x = x + 15
         if number is not None:
             num_color = self.highlight_color if selected else COLOR_GRAY
-            num_surf = self.font_small.render(f"{number}.", True, num_color)
+            num_surf = _render_text(self.font_small, f"{number}.", num_color)
             self.screen.blit(num_surf, (text_x, y + 8))
             text_x += 20
 
@@ -354,60 +405,75 @@ class MenuRenderer:
 
         # Main text
         text_color = COLOR_WHITE if selected else (180, 180, 190)
-        text_surf = self.font_medium.render(text, True, text_color)
+        text_surf = _render_text(self.font_medium, text, text_color)
         self.screen.blit(text_surf, (text_x, y + 6))
 
         # Description
         if description and selected:
-            desc_surf = self.font_small.render(description, True, (140, 145, 160))
+            desc_surf = _render_text(self.font_small, description,
+                                     (140, 145, 160))
             self.screen.blit(desc_surf, (text_x, y + 28))
 
         return height
 
     def _draw_menu_icon(self, x: int, y: int, icon_type: str, color: tuple):
         """Draw menu icons."""
+        key = (icon_type, color)
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            icon = self._build_menu_icon(icon_type, color)
+            self._icon_cache[key] = icon
+
+        # Centered on (x, y); the margin covers the widest strokes
+        # (dumbbell ends, brain cogs)
+        self.screen.blit(icon, (x - 14, y - 14))
+
+    def _build_menu_icon(self, icon_type: str, color: tuple) -> pygame.Surface:
+        """Rasterize one menu icon onto a transparent surface."""
         size = 10
+        icon = pygame.Surface((28, 28), pygame.SRCALPHA)
+        x = y = 14
 
         if icon_type == 'train':
             # Dumbbell
-            pygame.draw.line(self.screen, color, (x - size, y), (x + size, y), 3)
-            pygame.draw.rect(self.screen, color, (x - size - 3, y - 4, 6, 8))
-            pygame.draw.rect(self.screen, color, (x + size - 3, y - 4, 6, 8))
+            pygame.draw.line(icon, color, (x - size, y), (x + size, y), 3)
+            pygame.draw.rect(icon, color, (x - size - 3, y - 4, 6, 8))
+            pygame.draw.rect(icon, color, (x + size - 3, y - 4, 6, 8))
         elif icon_type == 'equipment':
             # Chest/box
-            pygame.draw.rect(self.screen, color, (x - size, y - size // 2, size * 2, size), 2)
-            pygame.draw.line(self.screen, color, (x - size, y), (x + size, y), 1)
+            pygame.draw.rect(icon, color, (x - size, y - size // 2, size * 2, size), 2)
+            pygame.draw.line(icon, color, (x - size, y), (x + size, y), 1)
         elif icon_type == 'skills':
             # Star
             for i in range(5):
                 angle = -math.pi / 2 + i * 2 * math.pi / 5
                 px = x + int(size * math.cos(angle))
                 py = y + int(size * math.sin(angle))
-                pygame.draw.line(self.screen, color, (x, y), (px, py), 2)
+                pygame.draw.line(icon, color, (x, y), (px, py), 2)
         elif icon_type == 'strategy':
             # Chess piece / brain
-            pygame.draw.circle(self.screen, color, (x, y - 3), 5)
-            pygame.draw.rect(self.screen, color, (x - 4, y + 2, 8, 4))
+            pygame.draw.circle(icon, color, (x, y - 3), 5)
+            pygame.draw.rect(icon, color, (x - 4, y + 2, 8, 4))
         elif icon_type == 'brain':
             # Brain/cog
-            pygame.draw.circle(self.screen, color, (x, y), 6, 2)
+            pygame.draw.circle(icon, color, (x, y), 6, 2)
             for i in range(6):
                 angle = i * math.pi / 3
                 px = x + int(8 * math.cos(angle))
                 py = y + int(8 * math.sin(angle))
-                pygame.draw.circle(self.screen, color, (px, py), 2)
+                pygame.draw.circle(icon, color, (px, py), 2)
         elif icon_type == 'climb':
             # Arrow up
-            pygame.draw.polygon(self.screen, color, [
+            pygame.draw.polygon(icon, color, [
                 (x, y - size),
                 (x - size, y + size // 2),
                 (x + size, y + size // 2)
             ])
         elif icon_type == 'sword':
-            pygame.draw.line(self.screen, color, (x, y - size), (x, y + size), 2)
-            pygame.draw.line(self.screen, color, (x - 5, y - 3), (x + 5, y - 3), 2)
+            pygame.draw.line(icon, color, (x, y - size), (x, y + size), 2)
+            pygame.draw.line(icon, color, (x - 5, y - 3), (x + 5, y - 3), 2)
         elif icon_type == 'shield':
-            pygame.draw.polygon(self.screen, color, [
+            pygame.draw.polygon(icon, color, [
                 (x, y - size),
                 (x + size, y - size // 2),
                 (x + size, y + size // 2),
@@ -423,17 +489,19 @@ class MenuRenderer:
                 (x + 2, y),
                 (x - 3, y + size)
             ]
-            pygame.draw.lines(self.screen, color, False, points, 2)
+            pygame.draw.lines(icon, color, False, points, 2)
         elif icon_type == 'star':
             # 5-pointed star
             for i in range(5):
                 angle = -math.pi / 2 + i * 2 * math.pi / 5
                 px = x + int(size * math.cos(angle))
                 py = y + int(size * math.sin(angle))
-                pygame.draw.line(self.screen, color, (x, y), (px, py), 2)
+                pygame.draw.line(icon, color, (x, y), (px, py), 2)
+
+        return icon
 
     def draw_controls_hint(self, y: int, text: str):
         """Draw controls hint at bottom of screen."""
-        hint_surf = self.font_small.render(text, True, (100, 105, 120))
+        hint_surf = _render_text(self.font_small, text, (100, 105, 120))
         hint_rect = hint_surf.get_rect(center=(SCREEN_WIDTH // 2, y))
         self.screen.blit(hint_surf, hint_rect)
@@ -308,11 +308,11 @@ class Renderer:
         sprite = None
 
         # Check for boss sprites first (elemental bosses)
-        if enemy.element == ELEMENT_FIRE:
+        if enemy.element is ELEMENT_FIRE:
             sprite = sprite_manager.get_sprite('boss_fire')
-        elif enemy.element == ELEMENT_ICE:
+        elif enemy.element is ELEMENT_ICE:
             sprite = sprite_manager.get_sprite('boss_ice')
-        elif enemy.element == ELEMENT_POISON:
+        elif enemy.element is ELEMENT_POISON:
             sprite = sprite_manager.get_sprite('boss_poison')
         # Then check enemy type
         elif enemy.enemy_type == 'tank':
@@ -374,13 +374,13 @@ class Renderer:
                 primary_color = COLOR_BOSS
                 secondary_color = (160, 40, 160)
 
-            if enemy.element == ELEMENT_FIRE:
+            if enemy.element is ELEMENT_FIRE:
                 primary_color = COLOR_FIRE_ENEMY
                 secondary_color = (200, 80, 0)
-            elif enemy.element == ELEMENT_ICE:
+            elif enemy.element is ELEMENT_ICE:
                 primary_color = COLOR_ICE_ENEMY
                 secondary_color = (80, 160, 200)
-            elif enemy.element == ELEMENT_POISON:
+            elif enemy.element is ELEMENT_POISON:
                 primary_color = COLOR_POISON_ENEMY
                 secondary_color = (80, 160, 40)
 
@@ -415,11 +415,11 @@ class Renderer:
         if enemy.element:
             element_prefix = enemy.element.upper()
             label = f"{element_prefix} {label}"
-            if enemy.element == ELEMENT_FIRE:
+            if enemy.element is ELEMENT_FIRE:
                 label_color = COLOR_FIRE_ENEMY
-            elif enemy.element == ELEMENT_ICE:
+            elif enemy.element is ELEMENT_ICE:
                 label_color = COLOR_ICE_ENEMY
-            elif enemy.element == ELEMENT_POISON:
+            elif enemy.element is ELEMENT_POISON:
                 label_color = COLOR_POISON_ENEMY
 
         # Draw label
@@ -467,15 +467,15 @@ class Renderer:
         icon_x = int(entity.x) + 25
         icon_y = int(entity.y) - 50
 
-        for i, effect in enumerate(effects):
+        for i, effect in enumerate(effects.values()):
             # Determine color based on effect type
-            if effect.effect_type == ELEMENT_FIRE:
+            if effect.effect_type is ELEMENT_FIRE:
                 color = COLOR_FIRE_ENEMY
                 symbol = "B"  # Burn
-            elif effect.effect_type == ELEMENT_ICE:
+            elif effect.effect_type is ELEMENT_ICE:
                 color = COLOR_ICE_ENEMY
                 symbol = "F"  # Freeze
-            elif effect.effect_type == ELEMENT_POISON:
+            elif effect.effect_type is ELEMENT_POISON:
                 color = COLOR_POISON_ENEMY
                 symbol = "P"  # Poison
             else:
@@ -497,11 +497,11 @@ class Renderer:
         if color:
             outer_color = color
         elif hasattr(projectile, 'element') and projectile.element:
-            if projectile.element == ELEMENT_FIRE:
+            if projectile.element is ELEMENT_FIRE:
                 outer_color = COLOR_FIRE_ENEMY
-            elif projectile.element == ELEMENT_ICE:
+            elif projectile.element is ELEMENT_ICE:
                 outer_color = COLOR_ICE_ENEMY
-            elif projectile.element == ELEMENT_POISON:
+            elif projectile.element is ELEMENT_POISON:
                 outer_color = COLOR_POISON_ENEMY
             else:
                 outer_color = COLOR_YELLOW